@@ -3,6 +3,7 @@ import json
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+import ujson
 from bidict import bidict
 
 from hummingbot.connector.constants import s_decimal_NaN
@@ -200,7 +201,7 @@ class CoindcxExchange(ExchangePyBase):
         """
         Returns the prices for all trading pairs.
         """
-        pairs_prices = await self._api_get(path_url=CONSTANTS.TICKER_PATH_URL)
+        pairs_prices = await self._api_get(path_url=CONSTANTS.TICKER_PATH_URL, json_loads=ujson.loads)
         return pairs_prices
 
     async def get_all_24h_volume_tickers(self, trading_pairs: Optional[List[str]] = None) -> List[Dict[str, str]]:
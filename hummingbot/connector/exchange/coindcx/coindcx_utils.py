@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict
 
 from pydantic import ConfigDict, Field, SecretStr
@@ -15,6 +16,10 @@ DEFAULT_FEES = TradeFeeSchema(
     buy_percent_fee_deducted_from_returns=True
 )
 
+QUOTE_CURRENCIES = ("INR", "USDT", "USDC", "BTC", "ETH", "BUSD")
+_QUOTE_CURRENCY_SET = frozenset(QUOTE_CURRENCIES)
+_QUOTE_CURRENCY_LENGTHS = tuple(sorted({len(quote) for quote in QUOTE_CURRENCIES}, reverse=True))
+
 
 def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     """
@@ -46,6 +51,7 @@ def is_exchange_information_valid(exchange_info: Dict[str, Any]) -> bool:
     return True
 
 
+@lru_cache(maxsize=4096)
 def coindcx_pair_to_hb_pair(coindcx_pair: str) -> str:
     """
     Converts CoinDCX trading pair format to Hummingbot format.
@@ -59,10 +65,10 @@ def coindcx_pair_to_hb_pair(coindcx_pair: str) -> str:
         pair = coindcx_pair.split("-", 1)[1] if "-" in coindcx_pair else coindcx_pair
         return pair.replace("_", "-")
 
-    quote_currencies = ["INR", "USDT", "USDC", "BTC", "ETH", "BUSD"]
-    for quote in quote_currencies:
-        if coindcx_pair.endswith(quote):
-            base = coindcx_pair[:-len(quote)]
+    for quote_length in _QUOTE_CURRENCY_LENGTHS:
+        quote = coindcx_pair[-quote_length:]
+        if quote in _QUOTE_CURRENCY_SET:
+            base = coindcx_pair[:-quote_length]
             return f"{base}-{quote}"
 
     return coindcx_pair
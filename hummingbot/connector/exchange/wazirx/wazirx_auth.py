@@ -2,7 +2,7 @@ import asyncio
 import hashlib
 import hmac
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import aiohttp
 
@@ -23,13 +23,22 @@ class WazirxAuth(AuthBase):
     RECV_WINDOW = 60000
     AUTH_TOKEN_TIMEOUT = 900
 
-    def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
+    def __init__(self,
+                 api_key: str,
+                 secret_key: str,
+                 time_provider: TimeSynchronizer,
+                 session_provider: Optional[Callable[[], aiohttp.ClientSession]] = None):
         """
         Initialize the WazirX authentication handler.
+
+        :param session_provider: returns the long-lived HTTP session used for the server time and
+            auth token requests; when omitted the handler keeps its own session, released by close()
         """
         self.api_key = api_key
         self.secret_key = secret_key
         self.time_provider = time_provider
+        self._session_provider = session_provider
+        self._http_session: Optional[aiohttp.ClientSession] = None
         self._nonce_counter = 0
         self._nonce_lock = asyncio.Lock()
         self._last_timestamp = 0
@@ -37,24 +46,42 @@ class WazirxAuth(AuthBase):
         self._auth_key_timestamp: float = 0
 
     async def _get_timestamp(self) -> int:
+        # The server time request is made outside the lock so concurrent signers do not
+        # serialize on the network round trip; only the monotonic bump is guarded.
+        current_ts = await self._fetch_server_time_ms()
         async with self._nonce_lock:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(f"{CONSTANTS.REST_URL}{CONSTANTS.SERVER_TIME_PATH_URL}") as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            current_ts = int(data.get("serverTime", int(time.time() * 1000)))
-                        else:
-                            current_ts = int(time.time() * 1000)
-            except Exception:
-                current_ts = int(time.time() * 1000)
-
             if current_ts <= self._last_timestamp:
                 current_ts = self._last_timestamp + 1
 
             self._last_timestamp = current_ts
             return current_ts
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._session_provider is not None:
+            return self._session_provider()
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
+    async def close(self):
+        """
+        Close the HTTP session created by this handler. Sessions from session_provider belong to their owner.
+        """
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    async def _fetch_server_time_ms(self) -> int:
+        try:
+            session = self._get_http_session()
+            async with session.get(f"{CONSTANTS.REST_URL}{CONSTANTS.SERVER_TIME_PATH_URL}") as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return int(data.get("serverTime", int(time.time() * 1000)))
+        except Exception:
+            pass
+        return int(time.time() * 1000)
+
     def _generate_query_string(self, params: Dict[str, Any]) -> str:
         """
         Generate query string from parameters, preserving order.
@@ -107,16 +134,16 @@ class WazirxAuth(AuthBase):
 
         headers = self.get_headers()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=query_string, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    self._auth_key = data.get("auth_key")
-                    self._auth_key_timestamp = current_time
-                    return self._auth_key
-                else:
-                    error_text = await response.text()
-                    raise Exception(f"Failed to get auth token: {response.status} - {error_text}")
+        session = self._get_http_session()
+        async with session.post(url, data=query_string, headers=headers) as response:
+            if response.status == 200:
+                data = await response.json()
+                self._auth_key = data.get("auth_key")
+                self._auth_key_timestamp = current_time
+                return self._auth_key
+            else:
+                error_text = await response.text()
+                raise Exception(f"Failed to get auth token: {response.status} - {error_text}")
 
     async def ws_authenticate(self, request: WSRequest) -> WSRequest:
         await self.get_ws_auth_key()
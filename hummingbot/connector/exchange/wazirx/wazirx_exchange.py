@@ -1,10 +1,12 @@
 import asyncio
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import aiohttp
+import ujson
 from bidict import bidict
+from yarl import URL
 
 from hummingbot.connector.constants import s_decimal_NaN
 from hummingbot.connector.exchange.wazirx import wazirx_constants as CONSTANTS, wazirx_web_utils as web_utils
@@ -21,6 +23,8 @@ from hummingbot.core.data_type.user_stream_tracker_data_source import UserStream
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+_EMPTY_HEADERS: Dict[str, str] = {}
+
 
 class WazirxExchange(ExchangePyBase):
     """
@@ -48,6 +52,8 @@ class WazirxExchange(ExchangePyBase):
         self._domain = domain
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._last_trade_id: Dict[str, int] = {}
         super().__init__(balance_asset_limit, rate_limits_share_pct)
 
         if trading_required and trading_pairs:
@@ -60,7 +66,12 @@ class WazirxExchange(ExchangePyBase):
 
     @property
     def authenticator(self):
-        return WazirxAuth(api_key=self.api_key, secret_key=self.secret_key, time_provider=self._time_synchronizer)
+        return WazirxAuth(
+            api_key=self.api_key,
+            secret_key=self.secret_key,
+            time_provider=self._time_synchronizer,
+            session_provider=self._get_http_session,
+        )
 
     @property
     def name(self) -> str:
@@ -110,7 +121,7 @@ class WazirxExchange(ExchangePyBase):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
     async def get_all_pairs_prices(self) -> List[Dict[str, str]]:
-        pairs_prices = await self._api_get(path_url=CONSTANTS.TICKERS_PATH_URL)
+        pairs_prices = await self._api_get(path_url=CONSTANTS.TICKERS_PATH_URL, json_loads=ujson.loads)
         return pairs_prices
 
     async def get_all_24h_volume_tickers(self, trading_pairs: Optional[List[str]] = None) -> List[Dict[str, str]]:
@@ -180,37 +191,45 @@ class WazirxExchange(ExchangePyBase):
         Make an authenticated or unauthenticated request to the WazirX API.
         """
         url = f"{CONSTANTS.REST_URL}{path}"
-        params = params or {}
-
-        async with aiohttp.ClientSession() as session:
-            if is_auth_required:
-                auth: WazirxAuth = self._auth
-                _, query_string = await auth.add_auth_params(params)
-                headers = auth.get_headers()
-
-                if method.upper() == "GET":
-                    full_url = f"{url}?{query_string}"
-                    async with session.get(full_url, headers=headers) as response:
-                        return await self._handle_response(response, method, url)
-                elif method.upper() == "POST":
-                    async with session.post(url, data=query_string, headers=headers) as response:
-                        return await self._handle_response(response, method, url)
-                elif method.upper() == "DELETE":
-                    async with session.delete(url, data=query_string, headers=headers) as response:
-                        return await self._handle_response(response, method, url)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE") or (method == "DELETE" and not is_auth_required):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if is_auth_required:
+            auth: WazirxAuth = self._auth
+            _, query_string = await auth.add_auth_params(params or {})
+            headers = auth.get_headers()
+        else:
+            query_string = urlencode(params) if params else None
+            headers = _EMPTY_HEADERS
+
+        kwargs: Dict[str, Any] = {"headers": headers}
+        request_url: Union[str, URL] = url
+        if query_string is not None:
+            if method == "GET":
+                # The query is already encoded (and signed); passing it as params would make yarl quote it again
+                request_url = URL(f"{url}?{query_string}", encoded=True)
             else:
-                headers = {}
-                if method.upper() == "GET":
-                    async with session.get(url, params=params, headers=headers) as response:
-                        return await self._handle_response(response, method, url)
-                elif method.upper() == "POST":
-                    body = urlencode(params)
-                    async with session.post(url, data=body, headers=headers) as response:
-                        return await self._handle_response(response, method, url)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                kwargs["data"] = query_string
+
+        session = self._get_http_session()
+        async with session.request(method, request_url, **kwargs) as response:
+            return await self._handle_response(response, method, url)
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return the pooled HTTP session used for direct WazirX requests, creating it on first use.
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
+    async def stop_network(self):
+        await super().stop_network()
+        await self._auth.close()
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
 
     async def _handle_response(self, response: aiohttp.ClientResponse, method: str, url: str) -> Dict[str, Any]:
         if response.status >= 400:
@@ -291,6 +310,13 @@ class WazirxExchange(ExchangePyBase):
             return False
 
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
+        """
+        Format trading rules from exchange info in a worker thread, keeping the event loop free
+        while hundreds of symbols are parsed.
+        """
+        return await asyncio.to_thread(self._format_trading_rules_sync, exchange_info_dict)
+
+    def _format_trading_rules_sync(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
         Format trading rules from exchange info
         """
@@ -299,68 +325,70 @@ class WazirxExchange(ExchangePyBase):
         else:
             trading_pair_rules = exchange_info_dict.get("symbols", [])
 
-        retval: List[TradingRule] = []
+        rules = (self._trading_rule_from_exchange_rule(rule) for rule in trading_pair_rules)
+        return [trading_rule for trading_rule in rules if trading_rule is not None]
 
-        for rule in trading_pair_rules:
-            try:
-                symbol = rule.get("symbol", "")
-                if not symbol:
-                    continue
+    def _trading_rule_from_exchange_rule(self, rule: Dict[str, Any]) -> Optional[TradingRule]:
+        """
+        Build a TradingRule from a single exchange info symbol entry, or return None when the entry is skipped.
+        """
+        try:
+            symbol = rule.get("symbol", "")
+            if not symbol:
+                return None
+
+            base_asset = rule.get("baseAsset", "")
+            quote_asset = rule.get("quoteAsset", "")
+            if not base_asset or not quote_asset:
+                return None
+
+            hb_trading_pair = f"{base_asset.upper()}-{quote_asset.upper()}"
+
+            filters = rule.get("filters", [])
+            price_filter = next((f for f in filters if f.get("filterType") == "PRICE_FILTER"), {})
+            lot_size_filter = next((f for f in filters if f.get("filterType") == "LOT_SIZE"), {})
+            min_notional_filter = next(
+                (f for f in filters if f.get("filterType") in ["MIN_NOTIONAL", "NOTIONAL"]),
+                {},
+            )
 
-                base_asset = rule.get("baseAsset", "")
-                quote_asset = rule.get("quoteAsset", "")
-                if not base_asset or not quote_asset:
-                    continue
+            try:
+                min_order_size = Decimal(lot_size_filter.get("minQty", "1e-8"))
+            except Exception:
+                min_order_size = Decimal("1e-8")
 
-                hb_trading_pair = f"{base_asset.upper()}-{quote_asset.upper()}"
+            try:
+                max_order_size = Decimal(lot_size_filter.get("maxQty", "1e8"))
+            except Exception:
+                max_order_size = Decimal("1e8")
 
-                filters = rule.get("filters", [])
-                price_filter = next((f for f in filters if f.get("filterType") == "PRICE_FILTER"), {})
-                lot_size_filter = next((f for f in filters if f.get("filterType") == "LOT_SIZE"), {})
-                min_notional_filter = next(
-                    (f for f in filters if f.get("filterType") in ["MIN_NOTIONAL", "NOTIONAL"]),
-                    {},
-                )
+            try:
+                tick_size = Decimal(price_filter.get("tickSize", "1e-8"))
+            except Exception:
+                tick_size = Decimal("1e-8")
 
-                try:
-                    min_order_size = Decimal(lot_size_filter.get("minQty", "1e-8"))
-                except Exception:
-                    min_order_size = Decimal("1e-8")
-
-                try:
-                    max_order_size = Decimal(lot_size_filter.get("maxQty", "1e8"))
-                except Exception:
-                    max_order_size = Decimal("1e8")
-
-                try:
-                    tick_size = Decimal(price_filter.get("tickSize", "1e-8"))
-                except Exception:
-                    tick_size = Decimal("1e-8")
-
-                try:
-                    step_size = Decimal(lot_size_filter.get("stepSize", "1e-8"))
-                except Exception:
-                    step_size = Decimal("1e-8")
-
-                try:
-                    min_notional = Decimal(min_notional_filter.get("minNotional", "0"))
-                except Exception:
-                    min_notional = Decimal("0")
-
-                trading_rule = TradingRule(
-                    trading_pair=hb_trading_pair,
-                    min_order_size=min_order_size,
-                    max_order_size=max_order_size,
-                    min_price_increment=tick_size,
-                    min_base_amount_increment=step_size,
-                    min_quote_amount_increment=step_size,
-                    min_notional_size=min_notional,
-                )
-                retval.append(trading_rule)
+            try:
+                step_size = Decimal(lot_size_filter.get("stepSize", "1e-8"))
             except Exception:
-                self.logger().exception(f"Error parsing the trading pair rule {rule}. Skipping.")
+                step_size = Decimal("1e-8")
 
-        return retval
+            try:
+                min_notional = Decimal(min_notional_filter.get("minNotional", "0"))
+            except Exception:
+                min_notional = Decimal("0")
+
+            return TradingRule(
+                trading_pair=hb_trading_pair,
+                min_order_size=min_order_size,
+                max_order_size=max_order_size,
+                min_price_increment=tick_size,
+                min_base_amount_increment=step_size,
+                min_quote_amount_increment=step_size,
+                min_notional_size=min_notional,
+            )
+        except Exception:
+            self.logger().exception(f"Error parsing the trading pair rule {rule}. Skipping.")
+            return None
 
     async def _update_trading_fees(self):
         return
@@ -378,6 +406,8 @@ class WazirxExchange(ExchangePyBase):
                             order_data.get("status"),
                             OrderState.OPEN,
                         )
+                        if new_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
+                            self._forget_last_trade_id(tracked_order.exchange_order_id)
                         order_update = OrderUpdate(
                             trading_pair=tracked_order.trading_pair,
                             update_timestamp=event_message.get("timestamp", 0) / 1000,
@@ -410,6 +440,7 @@ class WazirxExchange(ExchangePyBase):
         trade_updates: List[TradeUpdate] = []
 
         if order.current_state in [OrderState.FAILED, OrderState.CANCELED]:
+            self._forget_last_trade_id(order.exchange_order_id)
             return trade_updates
 
         if order.exchange_order_id is not None:
@@ -418,6 +449,10 @@ class WazirxExchange(ExchangePyBase):
                 "symbol": symbol,
                 "orderId": order.exchange_order_id,
             }
+            last_trade_id = self._last_trade_id.get(order.exchange_order_id)
+            if last_trade_id is not None:
+                # Only request fills newer than the last one already seen for this order
+                params["fromId"] = last_trade_id + 1
 
             try:
                 resp = await self._wazirx_request(
@@ -454,6 +489,12 @@ class WazirxExchange(ExchangePyBase):
                         fill_timestamp=trade.get("time", 0) / 1000,
                     )
                     trade_updates.append(trade_update)
+
+                trade_ids = [int(trade["id"]) for trade in trades if str(trade.get("id", "")).isdigit()]
+                if order.is_done:
+                    self._forget_last_trade_id(order.exchange_order_id)
+                elif trade_ids:
+                    self._last_trade_id[order.exchange_order_id] = max(trade_ids + [last_trade_id or 0])
             except Exception as e:
                 error_msg = str(e)
                 if "429" in error_msg or "Too many" in error_msg:
@@ -463,8 +504,16 @@ class WazirxExchange(ExchangePyBase):
 
         return trade_updates
 
+    def _forget_last_trade_id(self, exchange_order_id: Optional[str]):
+        """
+        Drop the fill cursor kept for an order once it reaches a terminal state.
+        """
+        if exchange_order_id is not None:
+            self._last_trade_id.pop(exchange_order_id, None)
+
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         if tracked_order.current_state in [OrderState.FAILED, OrderState.CANCELED]:
+            self._forget_last_trade_id(tracked_order.exchange_order_id)
             return OrderUpdate(
                 client_order_id=tracked_order.client_order_id,
                 exchange_order_id=tracked_order.exchange_order_id,
@@ -487,6 +536,8 @@ class WazirxExchange(ExchangePyBase):
         )
 
         new_state = CONSTANTS.ORDER_STATE.get(resp.get("status"), OrderState.OPEN)
+        if new_state in [OrderState.FILLED, OrderState.CANCELED, OrderState.FAILED]:
+            self._forget_last_trade_id(tracked_order.exchange_order_id)
         order_update = OrderUpdate(
             client_order_id=tracked_order.client_order_id,
             exchange_order_id=str(resp.get("id", resp.get("orderId", ""))),
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 
 from pydantic import ConfigDict, Field, SecretStr
 
@@ -14,7 +15,12 @@ DEFAULT_FEES = TradeFeeSchema(
     buy_percent_fee_deducted_from_returns=True
 )
 
+QUOTE_ASSETS = ("USDT", "INR")
+_QUOTE_ASSET_SET = frozenset(QUOTE_ASSETS)
+_QUOTE_ASSET_LENGTHS = tuple(sorted({len(quote) for quote in QUOTE_ASSETS}, reverse=True))
 
+
+@lru_cache(maxsize=4096)
 def wazirx_pair_to_hb_pair(symbol: str) -> str:
     """
     Convert WazirX symbol format to Hummingbot trading pair format.
@@ -36,12 +42,10 @@ def wazirx_pair_to_hb_pair(symbol: str) -> str:
         parts = s.split("_")
         return f"{parts[0]}-{parts[1]}"
 
-    quotes = ["USDT", "INR"]
-    for q in quotes:
-        if s.endswith(q):
-            base = s[:-len(q)]
-            if base:
-                return f"{base}-{q}"
+    for quote_length in _QUOTE_ASSET_LENGTHS:
+        quote = s[-quote_length:]
+        if quote in _QUOTE_ASSET_SET and len(s) > quote_length:
+            return f"{s[:-quote_length]}-{quote}"
     return s
 
 
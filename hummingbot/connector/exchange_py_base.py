@@ -920,6 +920,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             return_err: bool = False,
             limit_id: Optional[str] = None,
             headers: Optional[Dict[str, Any]] = None,
+            json_loads: Optional[Callable[[str], Any]] = None,
             **kwargs,
     ) -> Dict[str, Any]:
 
@@ -939,6 +940,7 @@ class ExchangePyBase(ExchangeBase, ABC):
                     return_err=return_err,
                     throttler_limit_id=limit_id if limit_id else path_url,
                     headers=headers,
+                    json_loads=json_loads,
                 )
 
                 return request_result
@@ -292,32 +292,36 @@ class MarketsRecorder:
         if not market_data_list:
             return
 
-        with self._sql_manager.get_new_session() as session:
-            timestamp = self.db_timestamp / 1000
-            for data in market_data_list:
-                best_bid = data['best_bid']
-                best_ask = data['best_ask']
-
-                mid_price = data.get('mid_price')
-                if mid_price is None:
-                    mid_price = (best_bid + best_ask) / 2
-
-                spread = data.get('spread')
-                if spread is None:
-                    spread = best_ask - best_bid
-                    spread = (spread / mid_price) * 100 if mid_price > 0 else 0
+        timestamp = self.db_timestamp / 1000
+        rows = []
+        for data in market_data_list:
+            best_bid = data['best_bid']
+            best_ask = data['best_ask']
+
+            mid_price = data.get('mid_price')
+            if mid_price is None:
+                mid_price = (best_bid + best_ask) / 2
+
+            spread = data.get('spread')
+            if spread is None:
+                spread = best_ask - best_bid
+                spread = (spread / mid_price) * 100 if mid_price > 0 else 0
+
+            rows.append({
+                "timestamp": timestamp,
+                "exchange": data['exchange'],
+                "trading_pair": data['trading_pair'],
+                "mid_price": mid_price,
+                "best_bid": best_bid,
+                "best_ask": best_ask,
+                # Stored unrounded: the old Numeric(5, 2) column also kept the full REAL value in SQLite
+                # and only quantized it on read
+                "spread": float(spread),
+                "order_book": data.get('order_book'),
+            })
 
-                market_data = MarketData(
-                    timestamp=timestamp,
-                    exchange=data['exchange'],
-                    trading_pair=data['trading_pair'],
-                    mid_price=mid_price,
-                    best_bid=best_bid,
-                    best_ask=best_ask,
-                    spread=spread,
-                    order_book=data.get('order_book')
-                )
-                session.add(market_data)
+        with self._sql_manager.get_new_session() as session:
+            MarketData.bulk_insert(session, rows)
             session.commit()
 
     def delete_old_market_data(self, cutoff_timestamp: float) -> int:
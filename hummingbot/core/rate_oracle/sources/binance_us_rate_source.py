@@ -1,40 +1,37 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_utils import safe_gather
 
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
 
+s_decimal_0 = Decimal(0)
+s_decimal_2 = Decimal(2)
+s_decimal_100 = Decimal(100)
+
 
 class BinanceUSRateSource(RateSourceBase):
     @property
     def name(self) -> str:
         return "binance_us"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchanges()
         results = {}
-        tasks = [
-            self._get_binance_prices(exchange=self._exchange, quote_token="USD"),
-        ]
-        task_results = await safe_gather(*tasks, return_exceptions=True)
-        for task_result in task_results:
-            if isinstance(task_result, Exception):
-                self.logger().error(
-                    msg="Unexpected error while retrieving rates from Binance. Check the log file for more info.",
-                    exc_info=task_result,
-                )
-                break
-            else:
-                results.update(task_result)
+        try:
+            pairs_prices = await self._get_all_pairs_prices()
+            results.update(await self._get_binance_prices(
+                exchange=self._exchange, pairs_prices=pairs_prices, quote_token="USD"
+            ))
+        except Exception:
+            self.logger().error(
+                msg="Unexpected error while retrieving rates from Binance. Check the log file for more info.",
+                exc_info=True,
+            )
         return results
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_bid_ask_prices(self, quote_token: Optional[str] = None) -> Dict[str, Dict[str, Decimal]]:
         """
         Fetches best bid and ask prices for all trading pairs from Binance US.
@@ -45,31 +42,25 @@ class BinanceUSRateSource(RateSourceBase):
         self._ensure_exchanges()
         results = {}
         try:
-            pairs_prices = await self._exchange.get_all_pairs_prices()
+            pairs_prices = await self._get_all_pairs_prices()
+            symbol_map = await self._trading_pair_symbol_map(self._exchange, quote_token)
             for pair_price in pairs_prices:
-                try:
-                    trading_pair = await self._exchange.trading_pair_associated_to_exchange_symbol(
-                        symbol=pair_price["symbol"]
-                    )
-                except KeyError:
+                trading_pair = symbol_map.get(pair_price["symbol"])
+                if trading_pair is None:
                     continue
 
-                if quote_token is not None:
-                    base, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                    if quote != quote_token:
-                        continue
-
                 bid_price = pair_price.get("bidPrice")
                 ask_price = pair_price.get("askPrice")
                 if bid_price is not None and ask_price is not None:
                     bid = Decimal(bid_price)
                     ask = Decimal(ask_price)
-                    if bid > 0 and ask > 0 and bid <= ask:
+                    if s_decimal_0 < bid <= ask:
+                        mid = (bid + ask) / s_decimal_2
                         results[trading_pair] = {
                             "bid": bid,
                             "ask": ask,
-                            "mid": (bid + ask) / Decimal("2"),
-                            "spread": ((ask - bid) / ((bid + ask) / Decimal("2"))) * Decimal("100")
+                            "mid": mid,
+                            "spread": (ask - bid) * s_decimal_100 / mid,
                         }
         except Exception:
             self.logger().exception(
@@ -77,30 +68,38 @@ class BinanceUSRateSource(RateSourceBase):
             )
         return results
 
+    @async_ttl_cache(ttl=30, maxsize=1)
+    async def _get_all_pairs_prices(self) -> List[Dict[str, Any]]:
+        """
+        Returns the raw book ticker payload shared by get_prices and get_bid_ask_prices.
+        """
+        return await self._exchange.get_all_pairs_prices()
+
     @staticmethod
-    async def _get_binance_prices(exchange: 'BinanceExchange', quote_token: str = None) -> Dict[str, Decimal]:
+    async def _get_binance_prices(
+        exchange: 'BinanceExchange', pairs_prices: List[Dict[str, Any]], quote_token: str = None
+    ) -> Dict[str, Decimal]:
         """
-        Fetches binance prices
+        Extracts binance mid prices from a book ticker payload
 
-        :param exchange: The exchange instance from which to query prices.
+        :param exchange: The exchange instance used to resolve trading pairs.
+        :param pairs_prices: The book ticker payload returned by the exchange.
         :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
         :return: A dictionary of trading pairs and prices
         """
-        pairs_prices = await exchange.get_all_pairs_prices()
         results = {}
+        symbol_map = await BinanceUSRateSource._trading_pair_symbol_map(exchange, quote_token)
         for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price["symbol"])
-            except KeyError:
+            trading_pair = symbol_map.get(pair_price["symbol"])
+            if trading_pair is None:
                 continue  # skip pairs that we don't track
-            if quote_token is not None:
-                base, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                if quote != quote_token:
-                    continue
             bid_price = pair_price.get("bidPrice")
             ask_price = pair_price.get("askPrice")
-            if bid_price is not None and ask_price is not None and 0 < Decimal(bid_price) <= Decimal(ask_price):
-                results[trading_pair] = (Decimal(bid_price) + Decimal(ask_price)) / Decimal("2")
+            if bid_price is not None and ask_price is not None:
+                bid = Decimal(bid_price)
+                ask = Decimal(ask_price)
+                if s_decimal_0 < bid <= ask:
+                    results[trading_pair] = (bid + ask) / s_decimal_2
 
         return results
 
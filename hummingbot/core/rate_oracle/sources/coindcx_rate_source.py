@@ -1,5 +1,5 @@
-from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
@@ -8,6 +8,25 @@ from hummingbot.core.utils.async_utils import safe_gather
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.coindcx.coindcx_exchange import CoindcxExchange
 
+s_decimal_0 = Decimal(0)
+s_decimal_2 = Decimal(2)
+s_decimal_100 = Decimal(100)
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    # String payloads are parsed directly; only JSON numbers go through str() to keep their decimal repr.
+    # JSON booleans are ints to isinstance, but are never a price
+    if type(value) is str:
+        try:
+            decimal_value = Decimal(value)
+        except InvalidOperation:
+            return None
+    elif isinstance(value, (int, float)) and type(value) is not bool:
+        decimal_value = Decimal(str(value))
+    else:
+        return None
+    return decimal_value if decimal_value.is_finite() else None
+
 
 class CoindcxRateSource(RateSourceBase):
     """
@@ -19,7 +38,6 @@ class CoindcxRateSource(RateSourceBase):
     def name(self) -> str:
         return "coindcx"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         """
         Fetches mid prices for all trading pairs.
@@ -29,24 +47,19 @@ class CoindcxRateSource(RateSourceBase):
         """
         self._ensure_exchanges()
         results: Dict[str, Decimal] = {}
-
-        tasks = [
-            self._get_coindcx_prices(exchange=self._exchange, quote_token=quote_token),
-        ]
-        task_results = await safe_gather(*tasks, return_exceptions=True)
-        for task_result in task_results:
-            if isinstance(task_result, Exception):
-                self.logger().error(
-                    msg="Unexpected error while retrieving rates from CoinDCX. Check the log file for more info.",
-                    exc_info=task_result,
-                )
-                break
-            else:
-                results.update(task_result)
+        try:
+            pairs_prices = await self._get_all_pairs_prices()
+            results.update(await self._get_coindcx_prices(
+                exchange=self._exchange, pairs_prices=pairs_prices, quote_token=quote_token
+            ))
+        except Exception:
+            self.logger().error(
+                msg="Unexpected error while retrieving rates from CoinDCX. Check the log file for more info.",
+                exc_info=True,
+            )
 
         return results
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_bid_ask_prices(self, quote_token: Optional[str] = None) -> Dict[str, Dict[str, Decimal]]:
         """
         Fetches best bid and ask prices for all trading pairs.
@@ -56,98 +69,82 @@ class CoindcxRateSource(RateSourceBase):
         """
         self._ensure_exchanges()
         results: Dict[str, Dict[str, Decimal]] = {}
-
-        tasks = [
-            self._get_coindcx_bid_ask_prices(exchange=self._exchange, quote_token=quote_token),
-        ]
-        task_results = await safe_gather(*tasks, return_exceptions=True)
-        for task_result in task_results:
-            if isinstance(task_result, Exception):
-                self.logger().error(
-                    msg="Unexpected error while retrieving bid/ask prices from CoinDCX. Check the log file for more info.",
-                    exc_info=task_result,
-                )
-                break
-            else:
-                results.update(task_result)
+        try:
+            pairs_prices = await self._get_all_pairs_prices()
+            results.update(await self._get_coindcx_bid_ask_prices(
+                exchange=self._exchange, pairs_prices=pairs_prices, quote_token=quote_token
+            ))
+        except Exception:
+            self.logger().error(
+                msg="Unexpected error while retrieving bid/ask prices from CoinDCX. Check the log file for more info.",
+                exc_info=True,
+            )
 
         return results
 
+    @async_ttl_cache(ttl=30, maxsize=1)
+    async def _get_all_pairs_prices(self) -> List[Dict[str, Any]]:
+        """
+        Returns the raw ticker payload shared by get_prices and get_bid_ask_prices.
+        A dict payload is only used when its values are ticker entries; a single probe of the first value is enough.
+        On a cold start the markets request behind the symbol map runs concurrently with the ticker request.
+        """
+        if self._exchange.trading_pair_symbol_map_ready():
+            pairs_prices = await self._exchange.get_all_pairs_prices()
+        else:
+            pairs_prices, _ = await safe_gather(
+                self._exchange.get_all_pairs_prices(),
+                self._exchange.trading_pair_symbol_map(),
+            )
+        if isinstance(pairs_prices, dict):
+            first_entry = next(iter(pairs_prices.values()), None)
+            pairs_prices = list(pairs_prices.values()) if isinstance(first_entry, dict) else []
+        return pairs_prices
+
     @staticmethod
-    async def _get_coindcx_prices(exchange: 'CoindcxExchange', quote_token: str = None) -> Dict[str, Decimal]:
-        results: Dict[str, Decimal] = {}
+    async def _get_coindcx_prices(
+        exchange: 'CoindcxExchange', pairs_prices: List[Dict[str, Any]], quote_token: str = None
+    ) -> Dict[str, Decimal]:
         if exchange is None:
-            return results
-
-        try:
-            pairs_prices = await exchange.get_all_pairs_prices()
-        except Exception:
-            return results
-
-        for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price.get("symbol") or pair_price.get("market"))
-            except Exception:
-                continue
-
-            if quote_token is not None:
-                base, quote = trading_pair.split("-")
-                if quote != quote_token:
-                    continue
-
-            bid_price = pair_price.get("bid") or pair_price.get("bidPrice")
-            ask_price = pair_price.get("ask") or pair_price.get("askPrice")
-            if bid_price is not None and ask_price is not None:
-                try:
-                    bid_dec = Decimal(str(bid_price))
-                    ask_dec = Decimal(str(ask_price))
-                    if bid_dec > 0 and ask_dec > 0:
-                        results[trading_pair] = (bid_dec + ask_dec) / Decimal("2")
-                except Exception:
-                    continue
+            return {}
+
+        symbol_map_get = (await CoindcxRateSource._trading_pair_symbol_map(exchange, quote_token)).get
+        results: Dict[str, Decimal] = {
+            trading_pair: (bid + ask) / s_decimal_2
+            for pair_price in pairs_prices
+            if (trading_pair := symbol_map_get(pair_price.get("symbol") or pair_price.get("market"))) is not None
+            and (bid := _to_decimal(pair_price.get("bid") or pair_price.get("bidPrice"))) is not None
+            and (ask := _to_decimal(pair_price.get("ask") or pair_price.get("askPrice"))) is not None
+            and bid > s_decimal_0 and ask > s_decimal_0
+        }
 
         return results
 
     @staticmethod
-    async def _get_coindcx_bid_ask_prices(exchange: 'CoindcxExchange', quote_token: str = None) -> Dict[str, Dict[str, Decimal]]:
+    async def _get_coindcx_bid_ask_prices(
+        exchange: 'CoindcxExchange', pairs_prices: List[Dict[str, Any]], quote_token: str = None
+    ) -> Dict[str, Dict[str, Decimal]]:
         results: Dict[str, Dict[str, Decimal]] = {}
         if exchange is None:
             return results
 
-        try:
-            pairs_prices = await exchange.get_all_pairs_prices()
-        except Exception:
-            return results
-
+        symbol_map_get = (await CoindcxRateSource._trading_pair_symbol_map(exchange, quote_token)).get
         for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price.get("symbol") or pair_price.get("market"))
-            except Exception:
+            pair_price_get = pair_price.get
+            trading_pair = symbol_map_get(pair_price_get("symbol") or pair_price_get("market"))
+            if trading_pair is None:
                 continue
 
-            if quote_token is not None:
-                base, quote = trading_pair.split("-")
-                if quote != quote_token:
-                    continue
-
-            bid_price = pair_price.get("bid") or pair_price.get("bidPrice")
-            ask_price = pair_price.get("ask") or pair_price.get("askPrice")
-            if bid_price is not None and ask_price is not None:
-                try:
-                    bid = Decimal(str(bid_price))
-                    ask = Decimal(str(ask_price))
-                    if bid > 0 and ask > 0 and bid <= ask:
-                        mid = (bid + ask) / Decimal("2")
-                        spread = ask - bid
-                        spread_pct = (spread / mid) * Decimal("100") if mid > 0 else Decimal("0")
-                        results[trading_pair] = {
-                            "bid": bid,
-                            "ask": ask,
-                            "mid": mid,
-                            "spread": spread_pct,
-                        }
-                except Exception:
-                    continue
+            bid = _to_decimal(pair_price_get("bid") or pair_price_get("bidPrice"))
+            ask = _to_decimal(pair_price_get("ask") or pair_price_get("askPrice"))
+            if bid is not None and ask is not None and s_decimal_0 < bid <= ask:
+                mid = (bid + ask) / s_decimal_2
+                results[trading_pair] = {
+                    "bid": bid,
+                    "ask": ask,
+                    "mid": mid,
+                    "spread": (ask - bid) * s_decimal_100 / mid,
+                }
 
         return results
 
@@ -1,5 +1,6 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from hummingbot.connector.exchange.coinswitch import coinswitch_constants as CONSTANTS
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
@@ -8,6 +9,22 @@ from hummingbot.core.utils import async_ttl_cache
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.coinswitch.coinswitch_exchange import CoinswitchExchange
 
+s_decimal_0 = Decimal(0)
+s_decimal_2 = Decimal(2)
+s_decimal_100 = Decimal(100)
+
+BID_PRICE_KEYS = ("bidPrice", "bid_price", "bid", "b", "bestBid", "best_bid")
+ASK_PRICE_KEYS = ("askPrice", "ask_price", "ask", "a", "bestAsk", "best_ask")
+LAST_PRICE_KEYS = ("lastPrice", "last_price", "last")
+
+
+def _first_value(ticker: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        value = ticker.get(key)
+        if value:
+            return value
+    return None
+
 
 class CoinswitchRateSource(RateSourceBase):
     """Rate source for CoinSwitch using the connector."""
@@ -22,13 +39,11 @@ class CoinswitchRateSource(RateSourceBase):
     def name(self) -> str:
         return "coinswitch"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchange()
         tickers = await self._fetch_all_tickers()
         return self._extract_mid_prices(tickers=tickers, quote_token=quote_token)
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_bid_ask_prices(self, quote_token: Optional[str] = None) -> Dict[str, Dict[str, Decimal]]:
         self._ensure_exchange()
         tickers = await self._fetch_all_tickers()
@@ -38,8 +53,12 @@ class CoinswitchRateSource(RateSourceBase):
         if self._coinswitch_exchange is None:
             self._coinswitch_exchange = self._build_coinswitch_connector_without_private_keys()
 
+    @async_ttl_cache(ttl=30, maxsize=1)
     async def _fetch_all_tickers(self) -> Dict[str, Dict[str, Decimal]]:
-        """Fetch all tickers from CoinSwitch using the public ticker API."""
+        """
+        Fetch all tickers from CoinSwitch using the public ticker API.
+        The result is shared by get_prices and get_bid_ask_prices within the cache TTL.
+        """
         try:
             response = await self._coinswitch_exchange.get_all_pairs_prices()
 
@@ -75,62 +94,78 @@ class CoinswitchRateSource(RateSourceBase):
 
     def _extract_mid_prices(self, tickers: Dict[str, Dict[str, Decimal]], quote_token: Optional[str]) -> Dict[str, Decimal]:
         results: Dict[str, Decimal] = {}
+        quote_suffixes = self._quote_suffixes(quote_token)
         for symbol, ticker in tickers.items():
+            if quote_suffixes is not None and not symbol.upper().endswith(quote_suffixes):
+                continue
             trading_pair = self._to_trading_pair(symbol)
             if trading_pair is None:
                 continue
-            if quote_token is not None and not trading_pair.endswith(f"-{quote_token}"):
-                continue
 
-            bid = self._to_decimal(ticker.get("bidPrice") or ticker.get("bid_price") or ticker.get("bid"))
-            ask = self._to_decimal(ticker.get("askPrice") or ticker.get("ask_price") or ticker.get("ask"))
-            last_price = self._to_decimal(ticker.get("lastPrice") or ticker.get("last_price") or ticker.get("last"))
+            bid = self._to_decimal(_first_value(ticker, BID_PRICE_KEYS))
+            ask = self._to_decimal(_first_value(ticker, ASK_PRICE_KEYS))
+
+            if s_decimal_0 < bid <= ask:
+                results[trading_pair] = (bid + ask) / s_decimal_2
+                continue
 
-            if bid > 0 and ask > 0 and bid <= ask:
-                results[trading_pair] = (bid + ask) / Decimal("2")
-            elif last_price > 0:
+            # The last price is only parsed for tickers without a usable book
+            last_price = self._to_decimal(_first_value(ticker, LAST_PRICE_KEYS))
+            if last_price > s_decimal_0:
                 results[trading_pair] = last_price
         return results
 
     def _extract_bid_ask(self, tickers: Dict[str, Dict[str, Decimal]], quote_token: Optional[str]) -> Dict[str, Dict[str, Decimal]]:
         results: Dict[str, Dict[str, Decimal]] = {}
+        quote_suffixes = self._quote_suffixes(quote_token)
         for symbol, ticker in tickers.items():
+            if quote_suffixes is not None and not symbol.upper().endswith(quote_suffixes):
+                continue
             trading_pair = self._to_trading_pair(symbol)
             if trading_pair is None:
                 continue
 
-            if quote_token is not None and not trading_pair.endswith(f"-{quote_token}"):
-                continue
-
-            bid = self._to_decimal(
-                ticker.get("bidPrice") or ticker.get("bid_price") or ticker.get("bid") or
-                ticker.get("b") or ticker.get("bestBid") or ticker.get("best_bid")
-            )
-            ask = self._to_decimal(
-                ticker.get("askPrice") or ticker.get("ask_price") or ticker.get("ask") or
-                ticker.get("a") or ticker.get("bestAsk") or ticker.get("best_ask")
-            )
+            bid = self._to_decimal(_first_value(ticker, BID_PRICE_KEYS))
+            ask = self._to_decimal(_first_value(ticker, ASK_PRICE_KEYS))
 
-            if bid > 0 and ask > 0 and bid <= ask:
-                mid = (bid + ask) / Decimal("2")
-                spread = ((ask - bid) / mid) * Decimal("100") if mid > 0 else Decimal("0")
+            if s_decimal_0 < bid <= ask:
+                mid = (bid + ask) / s_decimal_2
                 results[trading_pair] = {
                     "bid": bid,
                     "ask": ask,
                     "mid": mid,
-                    "spread": spread,
+                    "spread": ((ask - bid) / mid) * s_decimal_100,
                 }
 
         return results
 
     @staticmethod
-    def _to_decimal(value: Optional[Decimal]) -> Decimal:
-        try:
-            return Decimal(str(value)) if value is not None else Decimal("0")
-        except Exception:
-            return Decimal("0")
+    def _to_decimal(value: Any) -> Decimal:
+        # Strings, ints and Decimals are converted without the str() round-trip; floats keep their repr
+        value_type = type(value)
+        if value_type is Decimal:
+            decimal_value = value
+        elif value is None:
+            return s_decimal_0
+        else:
+            try:
+                decimal_value = Decimal(value) if value_type is str or value_type is int else Decimal(str(value))
+            except Exception:
+                return s_decimal_0
+        return decimal_value if decimal_value.is_finite() else s_decimal_0
+
+    @staticmethod
+    def _quote_suffixes(quote_token: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """
+        Raw symbol suffixes that normalize to a pair quoted in quote_token, so other quotes are dropped
+        before the symbol is normalized.
+        """
+        if quote_token is None:
+            return None
+        return tuple(f"{separator}{quote_token}" for separator in ("-", "_", "/"))
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def _to_trading_pair(symbol: str) -> Optional[str]:
         if not symbol:
             return None
@@ -1,7 +1,6 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
 
@@ -18,22 +17,16 @@ class HyperliquidRateSource(RateSourceBase):
     def name(self) -> str:
         return "hyperliquid"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         self._ensure_exchange()
         results = {}
         try:
-            pairs_prices = await self._exchange.get_all_pairs_prices()
+            pairs_prices = await self._get_all_pairs_prices()
+            symbol_map = await self._trading_pair_symbol_map(self._exchange, quote_token)
             for pair_price in pairs_prices:
-                pair = pair_price["symbol"]
-                try:
-                    trading_pair = await self._exchange.trading_pair_associated_to_exchange_symbol(symbol=pair)
-                except KeyError:
-                    continue  # skip pairs that we don't track
-                if quote_token is not None:
-                    base, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                    if quote != quote_token:
-                        continue
+                trading_pair = symbol_map.get(pair_price["symbol"])
+                if trading_pair is None:
+                    continue  # skip pairs that we don't track or that are not quoted in quote_token
                 price = pair_price["price"]
                 if price is not None:
                     results[trading_pair] = Decimal(price)
@@ -43,7 +36,6 @@ class HyperliquidRateSource(RateSourceBase):
             )
         return results
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_bid_ask_prices(self, quote_token: Optional[str] = None) -> Dict[str, Dict[str, Decimal]]:
         """
         Fetches best bid and ask prices for all trading pairs.
@@ -55,17 +47,12 @@ class HyperliquidRateSource(RateSourceBase):
         self._ensure_exchange()
         results = {}
         try:
-            pairs_prices = await self._exchange.get_all_pairs_prices()
+            pairs_prices = await self._get_all_pairs_prices()
+            symbol_map = await self._trading_pair_symbol_map(self._exchange, quote_token)
             for pair_price in pairs_prices:
-                pair = pair_price["symbol"]
-                try:
-                    trading_pair = await self._exchange.trading_pair_associated_to_exchange_symbol(symbol=pair)
-                except KeyError:
-                    continue
-                if quote_token is not None:
-                    base, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                    if quote != quote_token:
-                        continue
+                trading_pair = symbol_map.get(pair_price["symbol"])
+                if trading_pair is None:
+                    continue  # skip pairs that we don't track or that are not quoted in quote_token
                 price = pair_price.get("price")
                 bid = pair_price.get("bid", price)
                 ask = pair_price.get("ask", price)
@@ -86,6 +73,13 @@ class HyperliquidRateSource(RateSourceBase):
             )
         return results
 
+    @async_ttl_cache(ttl=30, maxsize=1)
+    async def _get_all_pairs_prices(self) -> List[Dict[str, Any]]:
+        """
+        Returns the raw ticker payload shared by get_prices and get_bid_ask_prices.
+        """
+        return await self._exchange.get_all_pairs_prices()
+
     def _ensure_exchange(self):
         if self._exchange is None:
             self._exchange = self._build_hyperliquid_connector_without_private_keys()
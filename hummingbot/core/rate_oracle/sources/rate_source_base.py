@@ -1,13 +1,17 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from cachetools import LRUCache
 
 from hummingbot.logger import HummingbotLogger
 
 
 class RateSourceBase(ABC):
     _logger: Optional[HummingbotLogger] = None
+    # (id(symbol map), quote token) -> (symbol map, quote filtered map); the source map is kept to detect id reuse
+    _quote_symbol_maps: LRUCache = LRUCache(maxsize=32)
 
     def __init__(self):
         self._exchange = None
@@ -30,6 +34,27 @@ class RateSourceBase(ABC):
     def _build_exchange(self):
         raise NotImplementedError
 
+    @staticmethod
+    async def _trading_pair_symbol_map(exchange: Any, quote_token: Optional[str] = None) -> Mapping[str, str]:
+        """
+        Returns the exchange symbol to trading pair map, restricted to pairs quoted in quote_token when given,
+        so ticker loops can drop other quotes with the same lookup that resolves the pair.
+        The filtered map is cached until the exchange replaces its symbol map.
+        """
+        symbol_map = await exchange.trading_pair_symbol_map()
+        if quote_token is None:
+            return symbol_map
+        cache_key = (id(symbol_map), quote_token)
+        cached: Optional[Tuple[Mapping[str, str], Dict[str, str]]] = RateSourceBase._quote_symbol_maps.get(cache_key)
+        if cached is not None and cached[0] is symbol_map:
+            return cached[1]
+        quote_suffix = f"-{quote_token}"
+        quote_symbol_map = {
+            symbol: trading_pair for symbol, trading_pair in symbol_map.items() if trading_pair.endswith(quote_suffix)
+        }
+        RateSourceBase._quote_symbol_maps[cache_key] = (symbol_map, quote_symbol_map)
+        return quote_symbol_map
+
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
@@ -1,14 +1,17 @@
 
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
-from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils import async_ttl_cache
 
 if TYPE_CHECKING:
     from hummingbot.connector.exchange.wazirx.wazirx_exchange import WazirxExchange
 
+s_decimal_0 = Decimal(0)
+s_decimal_2 = Decimal(2)
+s_decimal_100 = Decimal(100)
+
 
 class WazirxRateSource(RateSourceBase):
     """
@@ -19,75 +22,42 @@ class WazirxRateSource(RateSourceBase):
     def name(self) -> str:
         return "wazirx"
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
-        self._ensure_exchanges()
-        results = await self._get_wazirx_prices(exchange=self._exchange, quote_token=quote_token)
+        # Mid prices are a projection of the bid/ask view over the same cached tickers
+        bid_ask_prices = await self.get_bid_ask_prices(quote_token=quote_token)
+        results = {trading_pair: prices["mid"] for trading_pair, prices in bid_ask_prices.items()}
         return results
 
-    @async_ttl_cache(ttl=30, maxsize=1)
     async def get_bid_ask_prices(self, quote_token: Optional[str] = None) -> Dict[str, Dict[str, Decimal]]:
         self._ensure_exchanges()
-        results = await self._get_wazirx_bid_ask_prices(exchange=self._exchange, quote_token=quote_token)
+        pairs_prices = await self._get_all_pairs_prices()
+        results = await self._get_wazirx_bid_ask_prices(
+            exchange=self._exchange, pairs_prices=pairs_prices, quote_token=quote_token
+        )
         return results
 
-    @staticmethod
-    async def _get_wazirx_prices(exchange: "WazirxExchange", quote_token: Optional[str] = None) -> Dict[str, Decimal]:
-        pairs_prices = await exchange.get_all_pairs_prices()
-        results = {}
-
-        for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price["symbol"])
-            except KeyError:
-                base = pair_price.get("baseAsset", "").upper()
-                quote = pair_price.get("quoteAsset", "").upper()
-                if base and quote:
-                    trading_pair = f"{base}-{quote}"
-                else:
-                    continue
-
-            if quote_token is not None:
-                _, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                if quote != quote_token:
-                    continue
-
-            bid_price = pair_price.get("bidPrice")
-            ask_price = pair_price.get("askPrice")
-
-            if bid_price is not None and ask_price is not None:
-                try:
-                    bid = Decimal(str(bid_price))
-                    ask = Decimal(str(ask_price))
-                    if bid > 0 and ask > 0 and bid <= ask:
-                        results[trading_pair] = (bid + ask) / Decimal("2")
-                except Exception:
-                    continue
-
-        return results
+    @async_ttl_cache(ttl=30, maxsize=1)
+    async def _get_all_pairs_prices(self) -> List[Dict[str, Any]]:
+        """
+        Returns the raw ticker payload. This is the only cached layer, so derived prices are never older than one TTL.
+        """
+        return await self._exchange.get_all_pairs_prices()
 
     @staticmethod
     async def _get_wazirx_bid_ask_prices(
-        exchange: "WazirxExchange", quote_token: Optional[str] = None
+        exchange: "WazirxExchange", pairs_prices: List[Dict[str, Any]], quote_token: Optional[str] = None
     ) -> Dict[str, Dict[str, Decimal]]:
-        pairs_prices = await exchange.get_all_pairs_prices()
         results = {}
 
+        symbol_map = await exchange.trading_pair_symbol_map()
+        quote_suffix = f"-{quote_token}" if quote_token is not None else None
         for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price["symbol"])
-            except KeyError:
-                base = pair_price.get("baseAsset", "").upper()
-                quote = pair_price.get("quoteAsset", "").upper()
-                if base and quote:
-                    trading_pair = f"{base}-{quote}"
-                else:
-                    continue
+            trading_pair = WazirxRateSource._resolve_trading_pair(symbol_map=symbol_map, pair_price=pair_price)
+            if trading_pair is None:
+                continue
 
-            if quote_token is not None:
-                _, quote = split_hb_trading_pair(trading_pair=trading_pair)
-                if quote != quote_token:
-                    continue
+            if quote_suffix is not None and not trading_pair.endswith(quote_suffix):
+                continue
 
             bid_price = pair_price.get("bidPrice")
             ask_price = pair_price.get("askPrice")
@@ -96,9 +66,9 @@ class WazirxRateSource(RateSourceBase):
                 try:
                     bid = Decimal(str(bid_price))
                     ask = Decimal(str(ask_price))
-                    if bid > 0 and ask > 0 and bid <= ask:
-                        mid = (bid + ask) / Decimal("2")
-                        spread_pct = ((ask - bid) / mid) * Decimal("100") if mid > 0 else Decimal("0")
+                    if s_decimal_0 < bid <= ask:
+                        mid = (bid + ask) / s_decimal_2
+                        spread_pct = ((ask - bid) / mid) * s_decimal_100
                         results[trading_pair] = {
                             "bid": bid,
                             "ask": ask,
@@ -110,6 +80,16 @@ class WazirxRateSource(RateSourceBase):
 
         return results
 
+    @staticmethod
+    def _resolve_trading_pair(symbol_map: Mapping[str, str], pair_price: Dict[str, Any]) -> Optional[str]:
+        trading_pair = symbol_map.get(pair_price.get("symbol"))
+        if trading_pair is None:
+            base = pair_price.get("baseAsset", "").upper()
+            quote = pair_price.get("quoteAsset", "").upper()
+            if base and quote:
+                trading_pair = f"{base}-{quote}"
+        return trading_pair
+
     def _build_exchange(self) -> "WazirxExchange":
         from hummingbot.connector.exchange.wazirx.wazirx_exchange import WazirxExchange
 
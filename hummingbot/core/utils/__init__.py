@@ -1,6 +1,8 @@
+import asyncio
 import errno
 import functools
 import socket
+from typing import Dict
 
 import cachetools
 import numpy as np
@@ -9,18 +11,37 @@ import pandas as pd
 
 def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+    in_flight: Dict[str, asyncio.Future] = {}
 
     def decorator(fn):
+        def on_done(key: str, task: asyncio.Future):
+            # A call superseded by cache_clear or by a call on a newer event loop must not publish its result
+            if in_flight.get(key) is not task:
+                return
+            del in_flight[key]
+            if not task.cancelled() and task.exception() is None:
+                cache[key] = task.result()
+
+        def cache_clear():
+            cache.clear()
+            in_flight.clear()
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
             key = str((args, kwargs))
             try:
                 return cache[key]
             except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                pass
+            # Concurrent callers that miss the cache share the first caller's in-flight call
+            task = in_flight.get(key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                in_flight[key] = task
+                task.add_done_callback(functools.partial(on_done, key))
+            return await asyncio.shield(task)
 
-        memoize.cache_clear = lambda: cache.clear()
+        memoize.cache_clear = cache_clear
         return memoize
 
     return decorator
@@ -1,7 +1,7 @@
 import json
 from asyncio import wait_for
 from copy import deepcopy
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -44,7 +44,13 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+        json_loads: Optional[Callable[[str], Any]] = None,
     ) -> Union[str, Dict[str, Any]]:
+        """
+        Execute the request and return the decoded JSON body.
+
+        :param json_loads: optional decoder applied to the response text instead of the default JSON decoding
+        """
         response = await self.execute_request_and_get_response(
             url=url,
             throttler_limit_id=throttler_limit_id,
@@ -56,6 +62,8 @@ class RESTAssistant:
             timeout=timeout,
             headers=headers,
         )
+        if json_loads is not None:
+            return json_loads(await response.text())
         response_json = await response.json()
         return response_json
 
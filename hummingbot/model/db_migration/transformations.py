@@ -149,3 +149,68 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class ReplaceMarketDataIndexes(DatabaseTransformation):
+    migration_queries = [
+        'drop index if exists idx_market_data_timestamp;',
+        'drop index if exists idx_market_data_trading_pair;',
+        'drop index if exists idx_market_data_exchange;',
+        ('create index if not exists idx_market_data_trading_pair_timestamp '
+         'on "MarketData" (trading_pair, timestamp);'),
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for query in self.migration_queries:
+            db_handle.engine.execute(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "ReplaceMarketDataIndexes"
+
+    @property
+    def to_version(self):
+        return 20261015
+
+
+class ConvertMarketDataSpreadToFloat(DatabaseTransformation):
+    migration_queries = [
+        ('create table MarketData_dg_tmp'
+         '(	timestamp BIGINT not null,'
+         '	exchange TEXT not null,'
+         '	trading_pair TEXT not null,'
+         '	mid_price FLOAT not null,'
+         '	best_bid FLOAT not null,'
+         '	best_ask FLOAT not null,'
+         '	spread FLOAT,'
+         '	order_book JSON,'
+         '	primary key (timestamp, exchange, trading_pair)'
+         ');'),
+        ('insert into MarketData_dg_tmp(timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, '
+         'spread, order_book) '
+         'select timestamp, exchange, trading_pair, mid_price, best_bid, best_ask, CAST(spread AS REAL), '
+         'order_book from "MarketData";'),
+        'drop table "MarketData";',
+        'alter table MarketData_dg_tmp rename to "MarketData";',
+        'create index idx_market_data_trading_pair_timestamp on "MarketData" (trading_pair, timestamp);',
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        for query in self.migration_queries:
+            db_handle.engine.execute(query)
+        return db_handle
+
+    @property
+    def name(self):
+        return "ConvertMarketDataSpreadToFloat"
+
+    @property
+    def to_version(self):
+        return 20261016
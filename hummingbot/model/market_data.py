@@ -1,6 +1,7 @@
-import inspect
+from typing import Any, Dict, List
 
-from sqlalchemy import JSON, Column, Index, PrimaryKeyConstraint, Text, BigInteger, Float, Numeric
+from sqlalchemy import JSON, BigInteger, Column, Float, Index, PrimaryKeyConstraint, Text, insert
+from sqlalchemy.orm import Session
 
 from hummingbot.model import HummingbotBase
 
@@ -9,9 +10,8 @@ class MarketData(HummingbotBase):
     __tablename__ = "MarketData"
     __table_args__ = (
         PrimaryKeyConstraint("timestamp", "exchange", "trading_pair"),
-        Index("idx_market_data_timestamp", "timestamp"),
-        Index("idx_market_data_trading_pair", "trading_pair"),
-        Index("idx_market_data_exchange", "exchange"),
+        # Timestamp range scans are served by the primary key prefix
+        Index("idx_market_data_trading_pair_timestamp", "trading_pair", "timestamp"),
     )
 
     timestamp = Column(BigInteger, nullable=False)
@@ -20,9 +20,15 @@ class MarketData(HummingbotBase):
     mid_price = Column(Float, nullable=False)
     best_bid = Column(Float, nullable=False)
     best_ask = Column(Float, nullable=False)
-    spread = Column(Numeric(5, 2), nullable=True)
+    spread = Column(Float, nullable=True)
     order_book = Column(JSON)
 
     def __repr__(self) -> str:
-        list_of_fields = [f"{name}: {value}" for name, value in inspect.getmembers(self) if isinstance(value, Column)]
-        return ','.join(list_of_fields)
+        return f"MarketData(timestamp={self.timestamp}, exchange='{self.exchange}', " \
+               f"trading_pair='{self.trading_pair}', mid_price={self.mid_price}, best_bid={self.best_bid}, " \
+               f"best_ask={self.best_ask}, spread={self.spread}, order_book={self.order_book})"
+
+    @classmethod
+    def bulk_insert(cls, sql_session: Session, rows: List[Dict[str, Any]]) -> None:
+        if rows:
+            sql_session.execute(insert(cls), rows)
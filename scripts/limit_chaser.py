@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import os
 from decimal import Decimal
 from typing import Dict, Optional
@@ -126,16 +127,25 @@ class LimitChaserExecutorScript(ScriptStrategyBase):
         try:
             connector = self.connectors[self.config.connector_name]
             price_type = PriceType.BestBid if side == TradeType.BUY else PriceType.BestAsk
-            price = connector.get_price_by_type(self.config.trading_pair, price_type)
-            if price is None or price <= 0:
-                price = connector.get_price_by_type(self.config.trading_pair, PriceType.MidPrice)
-            if price is None or price <= 0:
-                return None
-            return Decimal(str(price))
+            price = self._valid_price(connector.get_price_by_type(self.config.trading_pair, price_type))
+            if price is None:
+                price = self._valid_price(connector.get_price_by_type(self.config.trading_pair, PriceType.MidPrice))
+            return price
         except Exception as e:
             self.logger().warning(f"Unable to fetch initial price: {e}")
             return None
 
+    @staticmethod
+    def _valid_price(price) -> Optional[Decimal]:
+        """Connectors already return Decimal prices; only other types are converted. NaN means an empty book."""
+        if price is None:
+            return None
+        if not isinstance(price, Decimal):
+            price = Decimal(str(price))
+        if price.is_nan() or price <= 0:
+            return None
+        return price
+
     def _build_executor_config(self, seed_price: Decimal, side: TradeType) -> OrderExecutorConfig:
         return OrderExecutorConfig(
             id=f"lc_{int(self.current_timestamp)}",
@@ -174,10 +184,10 @@ class LimitChaserExecutorScript(ScriptStrategyBase):
             )
             return
 
-        if self.current_timestamp - self._last_status_log > 5 and self._executor is not None:
-            if self._executor._order and self._executor._order.order:
-                price = self._executor._order.order.price
-                self.logger().info(f"Active chaser order id={self._executor._order.order_id} price={price}")
+        if self.current_timestamp - self._last_status_log > 5:
+            tracked_order = self._executor._order
+            if tracked_order and tracked_order.order and self.logger().isEnabledFor(logging.INFO):
+                self.logger().info(f"Active chaser order id={tracked_order.order_id} price={tracked_order.order.price}")
             self._last_status_log = self.current_timestamp
 
         if self._executor.is_closed and not self._reported_close:
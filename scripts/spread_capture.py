@@ -1,6 +1,9 @@
+import asyncio
+import importlib
+import logging
 import os
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from pydantic import Field
 
@@ -11,20 +14,22 @@ from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
-SUPPORTED_CONNECTORS = [
-    "binance",
-    "binance_perpetual",
-    "binance_us",
-    "kucoin",
-    "gate_io",
-    "mexc",
-    "ascend_ex",
-    "cube",
-    "hyperliquid",
-    "dexalot",
-    "coindcx",
-    "wazirx",
-]
+RATE_SOURCE_CLASSES: Dict[str, Tuple[str, str]] = {
+    "binance": ("hummingbot.core.rate_oracle.sources.binance_rate_source", "BinanceRateSource"),
+    "binance_us": ("hummingbot.core.rate_oracle.sources.binance_us_rate_source", "BinanceUSRateSource"),
+    "kucoin": ("hummingbot.core.rate_oracle.sources.kucoin_rate_source", "KucoinRateSource"),
+    "gate_io": ("hummingbot.core.rate_oracle.sources.gate_io_rate_source", "GateIoRateSource"),
+    "mexc": ("hummingbot.core.rate_oracle.sources.mexc_rate_source", "MexcRateSource"),
+    "ascend_ex": ("hummingbot.core.rate_oracle.sources.ascend_ex_rate_source", "AscendExRateSource"),
+    "cube": ("hummingbot.core.rate_oracle.sources.cube_rate_source", "CubeRateSource"),
+    "hyperliquid": ("hummingbot.core.rate_oracle.sources.hyperliquid_rate_source", "HyperliquidRateSource"),
+    "dexalot": ("hummingbot.core.rate_oracle.sources.dexalot_rate_source", "DexalotRateSource"),
+    "wazirx": ("hummingbot.core.rate_oracle.sources.wazirx_rate_source", "WazirxRateSource"),
+    "coindcx": ("hummingbot.core.rate_oracle.sources.coindcx_rate_source", "CoindcxRateSource"),
+    "coinswitch": ("hummingbot.core.rate_oracle.sources.coinswitch_rate_source", "CoinswitchRateSource"),
+}
+SUPPORTED_CONNECTORS = list(RATE_SOURCE_CLASSES)
+_SUPPORTED_CONNECTORS_LOWER = frozenset(RATE_SOURCE_CLASSES)
 
 
 class SpreadCaptureConfig(BaseClientModel):
@@ -80,62 +85,15 @@ def get_rate_source(connector_name: str) -> RateSourceBase:
     :return: The corresponding rate source instance
     :raises ValueError: If the connector is not supported
     """
-    connector_name_lower = connector_name.lower()
-
-    if connector_name_lower == "binance":
-        from hummingbot.core.rate_oracle.sources.binance_rate_source import BinanceRateSource
-
-        return BinanceRateSource()
-    elif connector_name_lower == "binance_us":
-        from hummingbot.core.rate_oracle.sources.binance_us_rate_source import BinanceUSRateSource
-
-        return BinanceUSRateSource()
-    elif connector_name_lower == "kucoin":
-        from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
-
-        return KucoinRateSource()
-    elif connector_name_lower == "gate_io":
-        from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
-
-        return GateIoRateSource()
-    elif connector_name_lower == "mexc":
-        from hummingbot.core.rate_oracle.sources.mexc_rate_source import MexcRateSource
-
-        return MexcRateSource()
-    elif connector_name_lower == "ascend_ex":
-        from hummingbot.core.rate_oracle.sources.ascend_ex_rate_source import AscendExRateSource
-
-        return AscendExRateSource()
-    elif connector_name_lower == "cube":
-        from hummingbot.core.rate_oracle.sources.cube_rate_source import CubeRateSource
-
-        return CubeRateSource()
-    elif connector_name_lower == "hyperliquid":
-        from hummingbot.core.rate_oracle.sources.hyperliquid_rate_source import HyperliquidRateSource
-
-        return HyperliquidRateSource()
-    elif connector_name_lower == "dexalot":
-        from hummingbot.core.rate_oracle.sources.dexalot_rate_source import DexalotRateSource
-
-        return DexalotRateSource()
-
-    elif connector_name_lower == "wazirx":
-        from hummingbot.core.rate_oracle.sources.wazirx_rate_source import WazirxRateSource
-
-        return WazirxRateSource()
-    elif connector_name_lower == "coindcx":
-        from hummingbot.core.rate_oracle.sources.coindcx_rate_source import CoindcxRateSource
-
-        return CoindcxRateSource()
-    elif connector_name_lower == "coinswitch":
-        from hummingbot.core.rate_oracle.sources.coinswitch_rate_source import CoinswitchRateSource
-
-        return CoinswitchRateSource()
-
-    else:
+    try:
+        module_name, class_name = RATE_SOURCE_CLASSES[connector_name.lower()]
+    except KeyError:
         raise ValueError(
             f"Unsupported connector: {connector_name}. Supported connectors: " f"{', '.join(SUPPORTED_CONNECTORS)}"
         )
+    # Rate source modules are imported on first use only, so the script does not load every connector
+    rate_source_class = getattr(importlib.import_module(module_name), class_name)
+    return rate_source_class()
 
 
 class SpreadCapture(ScriptStrategyBase):
@@ -166,7 +124,8 @@ class SpreadCapture(ScriptStrategyBase):
         self.excluding_pairs: Set[str] = self._parse_excluding_pairs(config.excluding_pairs)
         self.data_retention_days: int = config.data_retention_days
 
-        self.last_run: int = 0
+        self._next_run: float = 0.0
+        self._fetch_task: Optional[asyncio.Task] = None
         self._rate_source: Optional[RateSourceBase] = None
         self._initialized: bool = False
         self._initialize_rate_source()
@@ -174,7 +133,7 @@ class SpreadCapture(ScriptStrategyBase):
     def _initialize_rate_source(self):
         """Initialize the rate source based on the configured connector."""
         try:
-            if self.connector_name.lower() not in [c.lower() for c in SUPPORTED_CONNECTORS]:
+            if self.connector_name.lower() not in _SUPPORTED_CONNECTORS_LOWER:
                 self.logger().error(
                     f"Unsupported connector: {self.connector_name}. " f"Supported: {', '.join(SUPPORTED_CONNECTORS)}"
                 )
@@ -201,32 +160,32 @@ class SpreadCapture(ScriptStrategyBase):
 
             market_data_batch: List[dict] = []
             excluded_count = 0
+            exchange = self.connector_name
+            excluding_pairs = self.excluding_pairs
+            logger = self.logger()
+            # Per-pair lines are only formatted when INFO is enabled; a cycle can cover hundreds of pairs
+            log_pairs = logger.isEnabledFor(logging.INFO)
 
             for trading_pair, price_data in bid_ask_prices.items():
                 # Skip excluded pairs
-                if trading_pair in self.excluding_pairs:
+                if trading_pair in excluding_pairs:
                     excluded_count += 1
                     continue
 
-                bid = float(price_data["bid"])
-                ask = float(price_data["ask"])
-                mid_price = float(price_data["mid"])
-                spread = float(price_data["spread"])
-
-                self.logger().info(
-                    f"{trading_pair} → BID: {bid}, ASK: {ask}, SPREAD: {spread:.4f}%"
-                )
-
-                market_data_batch.append(
-                    {
-                        "exchange": self.connector_name,
-                        "trading_pair": trading_pair,
-                        "best_bid": bid,
-                        "best_ask": ask,
-                        "mid_price": mid_price,
-                        "spread": spread,
-                    }
-                )
+                market_data = {
+                    "exchange": exchange,
+                    "trading_pair": trading_pair,
+                    "best_bid": float(price_data["bid"]),
+                    "best_ask": float(price_data["ask"]),
+                    "mid_price": float(price_data["mid"]),
+                    "spread": float(price_data["spread"]),
+                }
+                if log_pairs:
+                    logger.info(
+                        "%s → BID: %s, ASK: %s, SPREAD: %.4f%%",
+                        trading_pair, market_data["best_bid"], market_data["best_ask"], market_data["spread"],
+                    )
+                market_data_batch.append(market_data)
 
             self.store_spread_data(market_data_batch)
             self.logger().info(
@@ -284,9 +243,13 @@ class SpreadCapture(ScriptStrategyBase):
         if not self._initialized:
             return
 
-        now = int(time.time())
-        if now - self.last_run < self.interval_sec:
+        now = time.monotonic()
+        if now < self._next_run:
+            return
+
+        # A slow exchange can still be answering the previous cycle; skip rather than stack requests
+        if self._fetch_task is not None and not self._fetch_task.done():
             return
 
-        self.last_run = now
-        safe_ensure_future(self.fetch_and_store_spread())
+        self._next_run = now + self.interval_sec
+        self._fetch_task = safe_ensure_future(self.fetch_and_store_spread())
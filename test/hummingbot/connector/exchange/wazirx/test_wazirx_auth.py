@@ -1,6 +1,6 @@
 import asyncio
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from typing_extensions import Awaitable
 
@@ -44,3 +44,57 @@ class WazirxAuthTests(TestCase):
 
         self.assertEqual({"X-Api-Key": self._api_key}, configured_request.headers)
         self.assertEqual(params, configured_request.params)
+
+    def test_server_time_fetch_reuses_provided_session(self):
+        response = MagicMock()
+        response.status = 200
+        response.json = AsyncMock(return_value={"serverTime": 1700000000000})
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=response)
+        request_context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock()
+        session.get.return_value = request_context
+        session_provider = MagicMock(return_value=session)
+
+        auth = WazirxAuth(
+            api_key=self._api_key,
+            secret_key=self._secret,
+            time_provider=MagicMock(),
+            session_provider=session_provider,
+        )
+        first = self.async_run_with_timeout(auth._get_timestamp())
+        second = self.async_run_with_timeout(auth._get_timestamp())
+
+        self.assertEqual(1700000000000, first)
+        self.assertEqual(1700000000001, second)
+        self.assertEqual(2, session.get.call_count)
+        self.assertEqual(2, session_provider.call_count)
+
+    def test_close_releases_the_session_created_without_provider(self):
+        auth = WazirxAuth(api_key=self._api_key, secret_key=self._secret, time_provider=MagicMock())
+
+        async def create_and_close():
+            session = auth._get_http_session()
+            self.assertIs(session, auth._get_http_session())
+            await auth.close()
+            return session
+
+        session = self.async_run_with_timeout(create_and_close())
+
+        self.assertTrue(session.closed)
+        self.assertIsNone(auth._http_session)
+
+    def test_close_leaves_provided_session_open(self):
+        session = MagicMock()
+        session.close = AsyncMock()
+        auth = WazirxAuth(
+            api_key=self._api_key,
+            secret_key=self._secret,
+            time_provider=MagicMock(),
+            session_provider=MagicMock(return_value=session),
+        )
+
+        self.assertIs(session, auth._get_http_session())
+        self.async_run_with_timeout(auth.close())
+
+        session.close.assert_not_called()
@@ -1,7 +1,9 @@
 
 import asyncio
 import json
+import re
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from aioresponses import aioresponses
@@ -410,7 +412,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 ]
             }
         ]
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(1, len(trading_rules))
         rule = trading_rules[0]
         self.assertEqual("BTC-USDT", rule.trading_pair)
@@ -432,7 +434,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 "filters": []
             }
         ]
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(1, len(trading_rules))
         rule = trading_rules[0]
         self.assertEqual("BTC-USDT", rule.trading_pair)
@@ -458,7 +460,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 ]
             }
         ]
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(1, len(trading_rules))
         rule = trading_rules[0]
         self.assertEqual("BTC-USDT", rule.trading_pair)
@@ -754,7 +756,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 }
             ]
         }
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(1, len(trading_rules))
         rule = trading_rules[0]
         self.assertEqual("BTC-USDT", rule.trading_pair)
@@ -776,7 +778,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 "filters": []
             }
         ]
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(0, len(trading_rules))
 
     def test_format_trading_rules_with_missing_base_asset(self):
@@ -791,7 +793,7 @@ class WazirxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests)
                 "filters": []
             }
         ]
-        trading_rules = self.exchange._format_trading_rules(raw_trading_rules)
+        trading_rules = self.exchange._format_trading_rules_sync(raw_trading_rules)
         self.assertEqual(0, len(trading_rules))
 
     @pytest.mark.asyncio
@@ -921,6 +923,32 @@ async def test_format_trading_rules_with_dict_input():
     assert isinstance(rules, list)
 
 
+@pytest.mark.asyncio
+async def test_format_trading_rules_matches_sync_formatting():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    payload = {"symbols": [
+        {
+            "symbol": "btcusdt",
+            "baseAsset": "BTC",
+            "quoteAsset": "USDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": "0.01"},
+                {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "minNotional": "10"},
+            ],
+        },
+        {"symbol": "ethusdt", "baseAsset": "ETH", "quoteAsset": "USDT", "filters": []},
+        {"symbol": "", "baseAsset": "XRP", "quoteAsset": "USDT", "filters": []},
+    ]}
+
+    rules = await exchange._format_trading_rules(payload)
+    expected = exchange._format_trading_rules_sync(payload)
+
+    assert [repr(rule) for rule in rules] == [repr(rule) for rule in expected]
+    assert [rule.trading_pair for rule in rules] == ["BTC-USDT", "ETH-USDT"]
+    assert rules[0].min_notional_size == Decimal("10")
+
+
 @pytest.mark.asyncio
 async def test_get_last_traded_prices_list_response():
     """Test that list responses are not processed (only dict responses are supported)."""
@@ -1005,3 +1033,345 @@ async def test_all_trade_updates_for_order_and_request_order_status():
     tu = updates[0]
     assert tu.trade_id == "1"
     assert float(tu.fill_price) == 123.0
+
+
+@pytest.mark.asyncio
+async def test_all_trade_updates_for_order_tracks_and_forgets_last_trade_id():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+
+    order = InFlightOrder(
+        client_order_id="c1",
+        exchange_order_id="42",
+        trading_pair="BTC-USDT",
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        price=Decimal("123.0"),
+        amount=Decimal("1"),
+        creation_timestamp=1650000000.0,
+        initial_state=OrderState.OPEN
+    )
+
+    trades_resp = [
+        {"id": "7", "orderId": "42", "commissionAsset": "USDT", "commission": "0.1",
+         "qty": "0.2", "quoteQty": "24.6", "price": "123.0", "time": 1650000000000},
+        {"id": "9", "orderId": "42", "commissionAsset": "USDT", "commission": "0.1",
+         "qty": "0.3", "quoteQty": "36.9", "price": "123.0", "time": 1650000001000},
+    ]
+    requested_params = []
+
+    async def mock_wazirx_request(method, path, params=None, is_auth_required=False):
+        requested_params.append(dict(params))
+        return trades_resp
+
+    exchange._wazirx_request = mock_wazirx_request
+    exchange._trade_fee_schema = {}
+
+    orig_new_spot_fee = TradeFeeBase.new_spot_fee
+    TradeFeeBase.new_spot_fee = staticmethod(
+        lambda fee_schema, trade_type, percent=Decimal(0), percent_token=None, flat_fees=None:
+        AddedToCostTradeFee(percent=percent, percent_token=percent_token, flat_fees=flat_fees or [])
+    )
+    try:
+        await exchange._all_trade_updates_for_order(order)
+        assert "fromId" not in requested_params[0]
+        assert exchange._last_trade_id["42"] == 9
+
+        await exchange._all_trade_updates_for_order(order)
+        assert requested_params[1]["fromId"] == 10
+    finally:
+        TradeFeeBase.new_spot_fee = orig_new_spot_fee
+
+    order.current_state = OrderState.CANCELED
+    updates = await exchange._all_trade_updates_for_order(order)
+    assert updates == []
+    assert "42" not in exchange._last_trade_id
+    assert len(requested_params) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_order_status_forgets_last_trade_id_on_terminal_state():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    order = InFlightOrder(
+        client_order_id="c1",
+        exchange_order_id="42",
+        trading_pair="BTC-USDT",
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        price=Decimal("123.0"),
+        amount=Decimal("1"),
+        creation_timestamp=1650000000.0,
+        initial_state=OrderState.OPEN
+    )
+    exchange._last_trade_id["42"] = 9
+
+    async def mock_wazirx_request(method, path, params=None, is_auth_required=False):
+        return {"id": 42, "status": "done", "updatedTime": 1650000002000}
+
+    exchange._wazirx_request = mock_wazirx_request
+
+    order_update = await exchange._request_order_status(order)
+
+    assert order_update.new_state == OrderState.FILLED
+    assert "42" not in exchange._last_trade_id
+
+
+_SERVER_TIME_MS = 1700000000000
+
+
+def _mock_server_time(mock_api):
+    mock_api.get(
+        f"{CONSTANTS.REST_URL}{CONSTANTS.SERVER_TIME_PATH_URL}",
+        payload={"serverTime": _SERVER_TIME_MS},
+        repeat=True,
+    )
+
+
+def _url_with_query_regex(path_url):
+    return re.compile(rf"^{re.escape(CONSTANTS.REST_URL + path_url)}\?")
+
+
+def _sent_requests(mock_api, method, path_url):
+    url = f"{CONSTANTS.REST_URL}{path_url}"
+    return [
+        (request_url, call.kwargs)
+        for (request_method, request_url), calls in mock_api.requests.items()
+        if request_method == method and str(request_url.with_query(None)) == url
+        for call in calls
+    ]
+
+
+def _spy_session_requests(exchange):
+    # aioresponses records a normalized URL, so the exact URL handed to aiohttp is read from a spy instead
+    session = exchange._get_http_session()
+    return patch.object(session, "request", wraps=session.request)
+
+
+def _requested_urls(request_spy, method, path_url):
+    url = f"{CONSTANTS.REST_URL}{path_url}"
+    return [
+        call.args[1] for call in request_spy.call_args_list
+        if call.args[0] == method and str(call.args[1]).split("?")[0] == url
+    ]
+
+
+def _signed_query(exchange, params, timestamp):
+    query_string = "&".join(f"{k}={v}" for k, v in {**params, "recvWindow": 60000, "timestamp": timestamp}.items())
+    return f"{query_string}&signature={exchange._auth.generate_signature(query_string)}"
+
+
+@pytest.mark.asyncio
+async def test_wazirx_request_signed_get_sends_query_string_as_params():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    # The note is already percent-encoded and is signed as is, so it must not be quoted again on the wire
+    params = {"symbol": "btcusdt", "orderId": "42", "note": "a+b%2Bc"}
+
+    with aioresponses() as mock_api, _spy_session_requests(exchange) as request_spy:
+        _mock_server_time(mock_api)
+        mock_api.get(_url_with_query_regex(CONSTANTS.ORDER_STATUS_PATH_URL), payload={"id": 42})
+        resp = await exchange._wazirx_request(
+            "GET", CONSTANTS.ORDER_STATUS_PATH_URL, params=dict(params), is_auth_required=True
+        )
+    await exchange._http_session.close()
+
+    assert resp == {"id": 42}
+    [(_, request_kwargs)] = _sent_requests(mock_api, "GET", CONSTANTS.ORDER_STATUS_PATH_URL)
+    assert "params" not in request_kwargs
+    assert "data" not in request_kwargs
+    assert request_kwargs["headers"]["X-Api-Key"] == "k"
+    expected_query = _signed_query(exchange, params, _SERVER_TIME_MS)
+    [request_url] = _requested_urls(request_spy, "GET", CONSTANTS.ORDER_STATUS_PATH_URL)
+    assert request_url.raw_query_string == expected_query
+    assert str(request_url) == f"{CONSTANTS.REST_URL}{CONSTANTS.ORDER_STATUS_PATH_URL}?{expected_query}"
+
+
+@pytest.mark.asyncio
+async def test_wazirx_request_signed_post_and_delete_send_query_string_as_body():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    order_params = {"symbol": "btcusdt", "side": "buy", "type": "limit", "quantity": "1", "price": "100"}
+    cancel_params = {"symbol": "btcusdt", "orderId": "42"}
+    url = f"{CONSTANTS.REST_URL}{CONSTANTS.CREATE_ORDER_PATH_URL}"
+
+    with aioresponses() as mock_api:
+        _mock_server_time(mock_api)
+        mock_api.post(url, payload={"id": 42})
+        mock_api.delete(url, payload={"id": 42})
+        await exchange._wazirx_request(
+            "POST", CONSTANTS.CREATE_ORDER_PATH_URL, params=dict(order_params), is_auth_required=True
+        )
+        await exchange._wazirx_request(
+            "delete", CONSTANTS.CANCEL_ORDER_PATH_URL, params=dict(cancel_params), is_auth_required=True
+        )
+    await exchange._http_session.close()
+
+    [(post_url, post_kwargs)] = _sent_requests(mock_api, "POST", CONSTANTS.CREATE_ORDER_PATH_URL)
+    assert str(post_url) == url
+    assert post_kwargs["data"] == _signed_query(exchange, order_params, _SERVER_TIME_MS)
+    assert "params" not in post_kwargs
+    assert post_kwargs["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+    [(delete_url, delete_kwargs)] = _sent_requests(mock_api, "DELETE", CONSTANTS.CANCEL_ORDER_PATH_URL)
+    assert str(delete_url) == url
+    # Signed timestamps never repeat, so the second request is stamped one millisecond later
+    assert delete_kwargs["data"] == _signed_query(exchange, cancel_params, _SERVER_TIME_MS + 1)
+    assert "params" not in delete_kwargs
+
+
+@pytest.mark.asyncio
+async def test_wazirx_request_unsigned_with_empty_params_sends_no_query():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    url = f"{CONSTANTS.REST_URL}{CONSTANTS.TICKERS_PATH_URL}"
+
+    with aioresponses() as mock_api:
+        mock_api.get(url, payload=[{"symbol": "btcusdt"}], repeat=True)
+        first = await exchange._wazirx_request("GET", CONSTANTS.TICKERS_PATH_URL)
+        second = await exchange._wazirx_request("GET", CONSTANTS.TICKERS_PATH_URL, params={})
+    await exchange._http_session.close()
+
+    assert first == second == [{"symbol": "btcusdt"}]
+    sent = _sent_requests(mock_api, "GET", CONSTANTS.TICKERS_PATH_URL)
+    assert len(sent) == 2
+    for request_url, request_kwargs in sent:
+        assert str(request_url) == url
+        assert request_kwargs["headers"] == {}
+        assert "params" not in request_kwargs
+        assert "data" not in request_kwargs
+    assert _sent_requests(mock_api, "GET", CONSTANTS.SERVER_TIME_PATH_URL) == []
+
+
+@pytest.mark.asyncio
+async def test_wazirx_request_rejects_unauthenticated_delete():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+
+    with aioresponses() as mock_api:
+        with pytest.raises(ValueError):
+            await exchange._wazirx_request("DELETE", CONSTANTS.CANCEL_ORDER_PATH_URL, params={"orderId": "42"})
+
+    assert mock_api.requests == {}
+    assert exchange._http_session is None
+
+
+@pytest.mark.asyncio
+async def test_stop_network_closes_http_session():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    session = exchange._get_http_session()
+
+    await exchange.stop_network()
+
+    assert session.closed
+    assert exchange._http_session is None
+
+
+@pytest.mark.asyncio
+async def test_trade_updates_poll_sends_from_id_and_keeps_cursor_across_empty_polls():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    order = InFlightOrder(
+        client_order_id="c1",
+        exchange_order_id="42",
+        trading_pair="BTC-USDT",
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        price=Decimal("123.0"),
+        amount=Decimal("1"),
+        creation_timestamp=1650000000.0,
+        initial_state=OrderState.PARTIALLY_FILLED
+    )
+    exchange._trade_fee_schema = {}
+    trades_url = _url_with_query_regex(CONSTANTS.MY_TRADES_PATH_URL)
+    first_fill = {"id": 7, "orderId": 42, "commissionAsset": "USDT", "commission": "0.1",
+                  "qty": "0.2", "quoteQty": "24.6", "price": "123.0", "time": 1650000000000}
+    second_fill = {"id": 9, "orderId": 42, "commissionAsset": "USDT", "commission": "0.1",
+                   "qty": "0.3", "quoteQty": "36.9", "price": "123.0", "time": 1650000002000}
+
+    orig_new_spot_fee = TradeFeeBase.new_spot_fee
+    TradeFeeBase.new_spot_fee = staticmethod(
+        lambda fee_schema, trade_type, percent=Decimal(0), percent_token=None, flat_fees=None:
+        AddedToCostTradeFee(percent=percent, percent_token=percent_token, flat_fees=flat_fees or [])
+    )
+    try:
+        with aioresponses() as mock_api, _spy_session_requests(exchange) as request_spy:
+            _mock_server_time(mock_api)
+            mock_api.get(trades_url, payload=[first_fill])
+            # A poll right after a reconnect can come back empty; the partially filled order keeps its cursor
+            mock_api.get(trades_url, payload=[])
+            mock_api.get(trades_url, payload=[second_fill])
+            first_updates = await exchange._all_trade_updates_for_order(order)
+            assert exchange._last_trade_id["42"] == 7
+            empty_updates = await exchange._all_trade_updates_for_order(order)
+            assert exchange._last_trade_id["42"] == 7
+            last_updates = await exchange._all_trade_updates_for_order(order)
+    finally:
+        TradeFeeBase.new_spot_fee = orig_new_spot_fee
+        await exchange._http_session.close()
+
+    assert [update.trade_id for update in first_updates] == ["7"]
+    assert empty_updates == []
+    assert [update.trade_id for update in last_updates] == ["9"]
+    assert exchange._last_trade_id["42"] == 9
+
+    sent = [url.raw_query_string for url in _requested_urls(request_spy, "GET", CONSTANTS.MY_TRADES_PATH_URL)]
+    assert sent == [
+        _signed_query(exchange, {"symbol": "btcusdt", "orderId": "42"}, _SERVER_TIME_MS),
+        _signed_query(exchange, {"symbol": "btcusdt", "orderId": "42", "fromId": 8}, _SERVER_TIME_MS + 1),
+        _signed_query(exchange, {"symbol": "btcusdt", "orderId": "42", "fromId": 8}, _SERVER_TIME_MS + 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_order_status_fill_forgets_last_trade_id():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    order = InFlightOrder(
+        client_order_id="c1",
+        exchange_order_id="42",
+        trading_pair="BTC-USDT",
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        price=Decimal("123.0"),
+        amount=Decimal("1"),
+        creation_timestamp=1650000000.0,
+        initial_state=OrderState.PARTIALLY_FILLED
+    )
+    exchange._last_trade_id["42"] = 7
+
+    with aioresponses() as mock_api:
+        _mock_server_time(mock_api)
+        mock_api.get(
+            _url_with_query_regex(CONSTANTS.ORDER_STATUS_PATH_URL),
+            payload={"id": 42, "status": "done", "updatedTime": 1650000002000},
+        )
+        order_update = await exchange._request_order_status(order)
+    await exchange._http_session.close()
+
+    assert order_update.new_state == OrderState.FILLED
+    assert "42" not in exchange._last_trade_id
+
+
+@pytest.mark.asyncio
+async def test_user_stream_cancel_forgets_last_trade_id():
+    exchange = WazirxExchange("k", "s", trading_pairs=["BTC-USDT"])
+    order = InFlightOrder(
+        client_order_id="c1",
+        exchange_order_id="42",
+        trading_pair="BTC-USDT",
+        order_type=OrderType.LIMIT,
+        trade_type=TradeType.BUY,
+        price=Decimal("123.0"),
+        amount=Decimal("1"),
+        creation_timestamp=1650000000.0,
+        initial_state=OrderState.PARTIALLY_FILLED
+    )
+    exchange._order_tracker.start_tracking_order(order)
+    exchange._last_trade_id["42"] = 7
+
+    async def mock_iter_queue():
+        yield {"event": "orderUpdate", "order": {"clientOrderId": "c1", "status": "cancel", "orderId": 42},
+               "timestamp": 1650000002000}
+        raise asyncio.CancelledError
+
+    exchange._iter_user_event_queue = mock_iter_queue
+    with pytest.raises(asyncio.CancelledError):
+        await exchange._user_stream_event_listener()
+    # The order tracker applies the update in a task of its own
+    await asyncio.sleep(0)
+
+    assert order.current_state == OrderState.CANCELED
+    assert "42" not in exchange._last_trade_id
@@ -60,6 +60,7 @@ class WazirxUserStreamDataSourceUnitTests(IsolatedAsyncioWrapperTestCase):
 
     async def asyncTearDown(self) -> None:
         self.listening_task and self.listening_task.cancel()
+        await self.auth.close()
         await super().asyncTearDown()
 
     def tearDown(self) -> None:
@@ -1123,6 +1123,37 @@ class MarketsRecorderTests(IsolatedAsyncioWrapperTestCase):
         self.assertEqual('binance', eth_record.exchange)
         self.assertAlmostEqual(float(eth_record.best_bid), 3000.0, places=2)
 
+    def test_store_market_data_stores_decimal_spread_as_float(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+
+        recorder.store_market_data([
+            {
+                'exchange': 'binance',
+                'trading_pair': 'BTC-USDT',
+                'best_bid': 50000.0,
+                'best_ask': 50010.0,
+                'mid_price': 50005.0,
+                'spread': Decimal("0.02"),
+            },
+        ])
+
+        with self.manager.get_new_session() as session:
+            record = session.query(MarketData).one()
+
+            self.assertEqual('BTC-USDT', record.trading_pair)
+            self.assertIsInstance(record.spread, float)
+            self.assertEqual(0.02, record.spread)
+
     def test_store_market_data_calculates_missing_values(self):
         """Test that store_market_data calculates mid_price, spread if not provided."""
         recorder = MarketsRecorder(
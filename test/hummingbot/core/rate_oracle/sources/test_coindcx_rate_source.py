@@ -17,23 +17,18 @@ class CoindcxRateSourceTest(IsolatedAsyncioWrapperTestCase):
         cls.trading_pair = combine_to_hb_trading_pair(base=cls.target_token, quote=cls.global_token)
         cls.ignored_trading_pair = combine_to_hb_trading_pair(base="SOME", quote="PAIR")
 
-    def setup_coindcx_responses(self, mock_tickers):
+    def setUp(self) -> None:
+        super().setUp()
+        # The TTL cache is keyed on the instance repr, which a new instance can reuse from a collected one
+        CoindcxRateSource._get_all_pairs_prices.cache_clear()
+
+    def setup_coindcx_responses(self, mock_tickers, mapping=None):
         exchange = CoindcxRateSource()._build_exchange()
-        mapping = bidict({mock_tickers[0].get("market") if mock_tickers and mock_tickers[0].get("market") else mock_tickers[0].get("symbol"): self.trading_pair})
+        if mapping is None:
+            mapping = bidict({mock_tickers[0].get("market") if mock_tickers and mock_tickers[0].get("market") else mock_tickers[0].get("symbol"): self.trading_pair})
         exchange._set_trading_pair_symbol_map(mapping)
 
         exchange.get_all_pairs_prices = AsyncMock(return_value=mock_tickers)
-
-        async def _resolve_symbol(symbol: str):
-            if symbol in mapping:
-                return mapping[symbol]
-            if symbol.endswith("USDT"):
-                return f"{symbol[:-4]}-USDT"
-            if symbol.endswith("INR"):
-                return f"{symbol[:-3]}-INR"
-            raise Exception("Unknown symbol")
-
-        exchange.trading_pair_associated_to_exchange_symbol = AsyncMock(side_effect=_resolve_symbol)
         return exchange
 
     async def test_get_coindcx_prices(self):
@@ -67,12 +62,35 @@ class CoindcxRateSourceTest(IsolatedAsyncioWrapperTestCase):
         self.assertEqual(Decimal("2.0"), price_data["spread"])
         self.assertNotIn(self.ignored_trading_pair, bid_ask_prices)
 
+    async def test_prices_follow_the_ticker_cache(self):
+        fake_ex = self.setup_coindcx_responses([{"market": "BTCUSDT", "bid": "100", "ask": "102"}])
+
+        rate_source = CoindcxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            first_prices = await rate_source.get_prices()
+            first_bid_ask_prices = await rate_source.get_bid_ask_prices()
+            fake_ex.get_all_pairs_prices.assert_awaited_once()
+
+            # Expiring the ticker cache must refresh both views; they keep no cache of their own
+            CoindcxRateSource._get_all_pairs_prices.cache_clear()
+            fake_ex.get_all_pairs_prices.return_value = [{"market": "BTCUSDT", "bid": "110", "ask": "112"}]
+            prices = await rate_source.get_prices()
+            bid_ask_prices = await rate_source.get_bid_ask_prices()
+
+        self.assertEqual({"BTC-USDT": Decimal("101")}, first_prices)
+        self.assertEqual(Decimal("101"), first_bid_ask_prices["BTC-USDT"]["mid"])
+        self.assertEqual({"BTC-USDT": Decimal("111")}, prices)
+        self.assertEqual(Decimal("111"), bid_ask_prices["BTC-USDT"]["mid"])
+        self.assertEqual(2, fake_ex.get_all_pairs_prices.await_count)
+
     async def test_get_prices_filters_by_quote_token(self):
         tickers = [
             {"market": "BTCUSDT", "bid": "100", "ask": "102"},
             {"market": "BTCINR", "bid": "200", "ask": "202"},
         ]
-        fake_ex = self.setup_coindcx_responses(tickers)
+        fake_ex = self.setup_coindcx_responses(
+            tickers, mapping=bidict({"BTCUSDT": "BTC-USDT", "BTCINR": "BTC-INR"})
+        )
 
         rate_source = CoindcxRateSource()
         with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
@@ -80,6 +98,9 @@ class CoindcxRateSourceTest(IsolatedAsyncioWrapperTestCase):
             self.assertIn("BTC-USDT", prices)
             self.assertNotIn("BTC-INR", prices)
 
+            inr_prices = await rate_source.get_prices(quote_token="INR")
+            self.assertEqual({"BTC-INR": Decimal("201")}, inr_prices)
+
     async def test_get_prices_with_none_bid_ask(self):
         tickers = [{"market": "BTCUSDT", "bid": None, "ask": "102"}]
         fake_ex = self.setup_coindcx_responses(tickers)
@@ -98,6 +119,20 @@ class CoindcxRateSourceTest(IsolatedAsyncioWrapperTestCase):
             prices = await rate_source.get_prices()
             self.assertEqual(prices, {})
 
+    async def test_get_prices_skips_boolean_fields(self):
+        tickers = [
+            {"market": "BTCUSDT", "bid": True, "ask": "102"},
+            {"market": "ETHUSDT", "bid": 10, "ask": 12.5},
+        ]
+        fake_ex = self.setup_coindcx_responses(
+            tickers, mapping=bidict({"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"})
+        )
+
+        rate_source = CoindcxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+            self.assertEqual({"ETH-USDT": Decimal("11.25")}, prices)
+
     async def test_get_bid_ask_prices_with_bid_greater_than_ask(self):
         tickers = [{"market": "BTCUSDT", "bid": "102", "ask": "100"}]
         fake_ex = self.setup_coindcx_responses(tickers)
@@ -117,17 +152,15 @@ class CoindcxRateSourceTest(IsolatedAsyncioWrapperTestCase):
             async def get_all_pairs_prices(self):
                 return self._tickers
 
-            async def trading_pair_associated_to_exchange_symbol(self, symbol: str):
-                if symbol == "BTCUSDT":
-                    return "BTC-USDT"
-                raise Exception("Unknown symbol")
+            async def trading_pair_symbol_map(self):
+                return bidict({"BTCUSDT": "BTC-USDT"})
 
         stub_ex = CoinDCXExchange(tickers)
 
-        prices = await CoindcxRateSource._get_coindcx_prices(exchange=stub_ex)
+        prices = await CoindcxRateSource._get_coindcx_prices(exchange=stub_ex, pairs_prices=tickers)
         assert prices.get("BTC-USDT") == Decimal("101")
 
-        bid_asks = await CoindcxRateSource._get_coindcx_bid_ask_prices(exchange=stub_ex)
+        bid_asks = await CoindcxRateSource._get_coindcx_bid_ask_prices(exchange=stub_ex, pairs_prices=tickers)
         entry = bid_asks.get("BTC-USDT")
         assert entry["bid"] == Decimal("100")
         assert entry["ask"] == Decimal("102")
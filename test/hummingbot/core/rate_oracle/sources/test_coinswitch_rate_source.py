@@ -0,0 +1,268 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.core.rate_oracle.sources.coinswitch_rate_source import CoinswitchRateSource
+
+
+class CoinswitchRateSourceTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # The TTL cache is keyed on the instance repr, which a new instance can reuse from a collected one
+        CoinswitchRateSource._fetch_all_tickers.cache_clear()
+
+    def setup_coinswitch_responses(self, tickers):
+        exchange = MagicMock()
+        exchange.get_all_pairs_prices = AsyncMock(return_value={"data": tickers})
+        return exchange
+
+    async def get_prices(self, tickers, quote_token=None):
+        fake_ex = self.setup_coinswitch_responses(tickers)
+        rate_source = CoinswitchRateSource()
+        with patch.object(rate_source, "_build_coinswitch_connector_without_private_keys", return_value=fake_ex):
+            return await rate_source.get_prices(quote_token=quote_token)
+
+    async def get_bid_ask_prices(self, tickers, quote_token=None):
+        fake_ex = self.setup_coinswitch_responses(tickers)
+        rate_source = CoinswitchRateSource()
+        with patch.object(rate_source, "_build_coinswitch_connector_without_private_keys", return_value=fake_ex):
+            return await rate_source.get_bid_ask_prices(quote_token=quote_token)
+
+    def test_name(self):
+        self.assertEqual("coinswitch", CoinswitchRateSource().name)
+
+    async def test_get_coinswitch_prices(self):
+        tickers = {"BTC/USDT": {"bidPrice": "100", "askPrice": "102"}}
+
+        prices = await self.get_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101")}, prices)
+
+    async def test_get_coinswitch_bid_ask_prices(self):
+        tickers = {"BTC/USDT": {"bidPrice": "100", "askPrice": "102"}}
+
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        price_data = bid_ask_prices["BTC-USDT"]
+        self.assertEqual(Decimal("100"), price_data["bid"])
+        self.assertEqual(Decimal("102"), price_data["ask"])
+        self.assertEqual(Decimal("101"), price_data["mid"])
+        self.assertEqual((Decimal("2") / Decimal("101")) * Decimal("100"), price_data["spread"])
+
+    async def test_tickers_fetched_once_for_prices_and_bid_ask_prices(self):
+        tickers = {"BTC/USDT": {"bidPrice": "100", "askPrice": "102"}}
+        fake_ex = self.setup_coinswitch_responses(tickers)
+
+        rate_source = CoinswitchRateSource()
+        with patch.object(rate_source, "_build_coinswitch_connector_without_private_keys", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+            bid_ask_prices = await rate_source.get_bid_ask_prices()
+
+        fake_ex.get_all_pairs_prices.assert_awaited_once()
+        self.assertEqual({"BTC-USDT": Decimal("101")}, prices)
+        self.assertEqual(Decimal("101"), bid_ask_prices["BTC-USDT"]["mid"])
+
+    async def test_prices_follow_the_ticker_cache(self):
+        fake_ex = self.setup_coinswitch_responses({"BTC/USDT": {"bidPrice": "100", "askPrice": "102"}})
+
+        rate_source = CoinswitchRateSource()
+        with patch.object(rate_source, "_build_coinswitch_connector_without_private_keys", return_value=fake_ex):
+            first_prices = await rate_source.get_prices()
+            # Expiring the ticker cache must refresh both views; they keep no cache of their own
+            CoinswitchRateSource._fetch_all_tickers.cache_clear()
+            fake_ex.get_all_pairs_prices.return_value = {"data": {"BTC/USDT": {"bidPrice": "110", "askPrice": "112"}}}
+            prices = await rate_source.get_prices()
+            bid_ask_prices = await rate_source.get_bid_ask_prices()
+
+        self.assertEqual({"BTC-USDT": Decimal("101")}, first_prices)
+        self.assertEqual({"BTC-USDT": Decimal("111")}, prices)
+        self.assertEqual(Decimal("111"), bid_ask_prices["BTC-USDT"]["mid"])
+        self.assertEqual(2, fake_ex.get_all_pairs_prices.await_count)
+
+    async def test_tickers_list_response_keyed_by_symbol(self):
+        tickers = [
+            {"symbol": "BTC/USDT", "bidPrice": "100", "askPrice": "102"},
+            {"s": "ETH_USDT", "bidPrice": "10", "askPrice": "12"},
+            {"bidPrice": "1", "askPrice": "2"},
+        ]
+
+        prices = await self.get_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101"), "ETH-USDT": Decimal("11")}, prices)
+
+    async def test_tickers_nested_under_exchange_name(self):
+        tickers = {"coinswitchx": {"BTC/USDT": {"bidPrice": "100", "askPrice": "102"}}}
+
+        prices = await self.get_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101")}, prices)
+
+    async def test_get_prices_logs_and_returns_empty_on_fetch_error(self):
+        fake_ex = MagicMock()
+        fake_ex.get_all_pairs_prices = AsyncMock(side_effect=IOError("test error"))
+
+        rate_source = CoinswitchRateSource()
+        with patch.object(rate_source, "_build_coinswitch_connector_without_private_keys", return_value=fake_ex):
+            with self.assertLogs(rate_source.logger(), level="ERROR"):
+                prices = await rate_source.get_prices()
+
+        self.assertEqual({}, prices)
+
+    async def test_quote_token_filter_on_raw_symbols(self):
+        tickers = {
+            "BTC-USDT": {"bidPrice": "100", "askPrice": "102"},
+            "ETH_USDT": {"bidPrice": "10", "askPrice": "12"},
+            "SOL/USDT": {"bidPrice": "20", "askPrice": "22"},
+            "xrp_usdt": {"bidPrice": "1", "askPrice": "3"},
+            "Ada/Usdt": {"bidPrice": "4", "askPrice": "6"},
+            "BTC/INR": {"bidPrice": "200", "askPrice": "202"},
+            "BTC-XUSDT": {"bidPrice": "30", "askPrice": "32"},
+            "BTCUSDT": {"bidPrice": "100", "askPrice": "102"},
+            "A-B-USDT": {"bidPrice": "100", "askPrice": "102"},
+            "A_B/USDT": {"bidPrice": "100", "askPrice": "102"},
+            "-USDT": {"bidPrice": "100", "askPrice": "102"},
+        }
+        all_pairs = ["BTC-USDT", "ETH-USDT", "SOL-USDT", "XRP-USDT", "ADA-USDT", "BTC-INR", "BTC-XUSDT"]
+        expected_pairs = {
+            None: all_pairs,
+            "USDT": ["BTC-USDT", "ETH-USDT", "SOL-USDT", "XRP-USDT", "ADA-USDT"],
+            "INR": ["BTC-INR"],
+            "usdt": [],
+        }
+
+        for quote_token, pairs in expected_pairs.items():
+            with self.subTest(quote_token=quote_token):
+                prices = await self.get_prices(tickers, quote_token=quote_token)
+                bid_ask_prices = await self.get_bid_ask_prices(tickers, quote_token=quote_token)
+
+                self.assertEqual(pairs, list(prices))
+                self.assertEqual(pairs, list(bid_ask_prices))
+
+    async def test_price_keys_read_in_priority_order(self):
+        tickers = {
+            "BTC/USDT": {"bidPrice": "100", "bid": "90", "b": "80", "askPrice": "102", "ask": "110", "a": "120"},
+            "ETH/USDT": {"bid_price": "10", "bestBid": "9", "ask_price": "12", "best_ask": "13"},
+            "SOL/USDT": {"bid": "20", "best_bid": "19", "ask": "22", "bestAsk": "23"},
+        }
+
+        prices = await self.get_prices(tickers)
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101"), "ETH-USDT": Decimal("11"), "SOL-USDT": Decimal("21")}, prices)
+        self.assertEqual(Decimal("100"), bid_ask_prices["BTC-USDT"]["bid"])
+        self.assertEqual(Decimal("102"), bid_ask_prices["BTC-USDT"]["ask"])
+
+    async def test_mid_price_reads_short_and_best_book_keys(self):
+        tickers = {
+            "BTC/USDT": {"b": "100", "a": "102", "lastPrice": "150"},
+            "ETH/USDT": {"bestBid": "10", "bestAsk": "12", "lastPrice": "15"},
+            "SOL/USDT": {"best_bid": "20", "best_ask": "22", "last": "25"},
+        }
+
+        prices = await self.get_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101"), "ETH-USDT": Decimal("11"), "SOL-USDT": Decimal("21")}, prices)
+
+    async def test_empty_and_zero_values_skip_to_next_key(self):
+        tickers = {
+            "BTC/USDT": {"bidPrice": "", "bid_price": 0, "bid": "100", "askPrice": None, "ask": "102"},
+            "ETH/USDT": {"lastPrice": "", "last_price": 0, "last": "11"},
+        }
+
+        prices = await self.get_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("101"), "ETH-USDT": Decimal("11")}, prices)
+
+    async def test_zero_string_is_read_as_a_zero_price(self):
+        # "0" is a non-empty string, so it is taken like any other value and leaves no usable book
+        tickers = {"BTC/USDT": {"bidPrice": "0", "bid": "100", "askPrice": "102", "lastPrice": "105"}}
+
+        prices = await self.get_prices(tickers)
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        self.assertEqual({"BTC-USDT": Decimal("105")}, prices)
+        self.assertEqual({}, bid_ask_prices)
+
+    async def test_mid_price_falls_back_to_last_price(self):
+        tickers = {
+            "BTC/USDT": {"bidPrice": "102", "askPrice": "100", "lastPrice": "101.5"},
+            "ETH/USDT": {"last_price": "11"},
+            "SOL/USDT": {"bidPrice": "20", "last": "21"},
+            "XRP/USDT": {"bidPrice": "2", "askPrice": "1"},
+            "ADA/USDT": {"lastPrice": "0"},
+        }
+
+        prices = await self.get_prices(tickers)
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        self.assertEqual(
+            {"BTC-USDT": Decimal("101.5"), "ETH-USDT": Decimal("11"), "SOL-USDT": Decimal("21")},
+            prices,
+        )
+        self.assertEqual({}, bid_ask_prices)
+
+    async def test_price_value_types(self):
+        tickers = {
+            "DEC/USDT": {"bidPrice": Decimal("100"), "askPrice": Decimal("102")},
+            "STR/USDT": {"bidPrice": "10", "askPrice": "12"},
+            "INT/USDT": {"bidPrice": 20, "askPrice": 22},
+            "FLT/USDT": {"bidPrice": 0.1, "askPrice": 0.3},
+            "BOOL/USDT": {"bidPrice": True, "askPrice": "102", "lastPrice": "101"},
+            "NONE/USDT": {"bidPrice": None, "askPrice": "102"},
+            "BAD/USDT": {"bidPrice": "not-a-number", "askPrice": "102"},
+        }
+
+        prices = await self.get_prices(tickers)
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        self.assertEqual(
+            {
+                "DEC-USDT": Decimal("101"),
+                "STR-USDT": Decimal("11"),
+                "INT-USDT": Decimal("21"),
+                "FLT-USDT": Decimal("0.2"),
+                "BOOL-USDT": Decimal("101"),
+            },
+            prices,
+        )
+        self.assertEqual(["DEC-USDT", "STR-USDT", "INT-USDT", "FLT-USDT"], list(bid_ask_prices))
+        self.assertEqual(Decimal("0.1"), bid_ask_prices["FLT-USDT"]["bid"])
+        self.assertEqual(Decimal("0.3"), bid_ask_prices["FLT-USDT"]["ask"])
+
+    async def test_non_finite_prices_are_treated_as_missing(self):
+        tickers = {
+            "NAN/USDT": {"bidPrice": "NaN", "askPrice": "102"},
+            "NANLAST/USDT": {"bidPrice": "NaN", "askPrice": "102", "lastPrice": "100"},
+            "INF/USDT": {"bidPrice": "100", "askPrice": "Infinity", "lastPrice": "101"},
+            "DECNAN/USDT": {"bidPrice": Decimal("NaN"), "askPrice": "102"},
+            "FLTNAN/USDT": {"bidPrice": float("nan"), "askPrice": "102"},
+            "FLTINF/USDT": {"bidPrice": "100", "askPrice": float("inf")},
+            "LASTNAN/USDT": {"lastPrice": "NaN"},
+            "LASTINF/USDT": {"lastPrice": "-Infinity"},
+        }
+
+        # A NaN bid used to raise InvalidOperation on the bid > 0 comparison
+        prices = await self.get_prices(tickers)
+        bid_ask_prices = await self.get_bid_ask_prices(tickers)
+
+        self.assertEqual({"NANLAST-USDT": Decimal("100"), "INF-USDT": Decimal("101")}, prices)
+        self.assertEqual({}, bid_ask_prices)
+
+    def test_to_decimal(self):
+        expected_values = [
+            (Decimal("1.5"), Decimal("1.5")),
+            ("1.5", Decimal("1.5")),
+            (3, Decimal("3")),
+            (0.1, Decimal("0.1")),
+            (True, Decimal("0")),
+            (None, Decimal("0")),
+            ("", Decimal("0")),
+            ("NaN", Decimal("0")),
+            ("Infinity", Decimal("0")),
+            (Decimal("NaN"), Decimal("0")),
+            (float("inf"), Decimal("0")),
+        ]
+
+        for value, expected in expected_values:
+            with self.subTest(value=value):
+                self.assertEqual(expected, CoinswitchRateSource._to_decimal(value))
@@ -0,0 +1,56 @@
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from bidict import bidict
+
+from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+
+
+class _StubExchange:
+    def __init__(self, symbol_map):
+        self.symbol_map = symbol_map
+
+    async def trading_pair_symbol_map(self):
+        return self.symbol_map
+
+
+class _CountingBidict(bidict):
+    def items(self):
+        _CountingBidict.items_calls += 1
+        return super().items()
+
+
+class RateSourceBaseTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        RateSourceBase._quote_symbol_maps.clear()
+        _CountingBidict.items_calls = 0
+
+    async def test_symbol_map_without_quote_is_returned_as_is(self):
+        symbol_map = bidict({"BTCUSDT": "BTC-USDT", "BTCINR": "BTC-INR"})
+        exchange = _StubExchange(symbol_map)
+
+        self.assertIs(symbol_map, await RateSourceBase._trading_pair_symbol_map(exchange))
+
+    async def test_quote_filtered_map_is_cached_per_symbol_map_and_quote(self):
+        exchange = _StubExchange(_CountingBidict({"BTCUSDT": "BTC-USDT", "BTCINR": "BTC-INR"}))
+
+        usdt_map = await RateSourceBase._trading_pair_symbol_map(exchange, "USDT")
+        self.assertEqual({"BTCUSDT": "BTC-USDT"}, usdt_map)
+        self.assertIs(usdt_map, await RateSourceBase._trading_pair_symbol_map(exchange, "USDT"))
+        self.assertEqual(1, _CountingBidict.items_calls)
+
+        inr_map = await RateSourceBase._trading_pair_symbol_map(exchange, "INR")
+        self.assertEqual({"BTCINR": "BTC-INR"}, inr_map)
+        self.assertEqual(2, _CountingBidict.items_calls)
+
+    async def test_quote_filtered_map_is_rebuilt_when_symbol_map_is_replaced(self):
+        exchange = _StubExchange(bidict({"BTCUSDT": "BTC-USDT"}))
+        self.assertEqual({"BTCUSDT": "BTC-USDT"}, await RateSourceBase._trading_pair_symbol_map(exchange, "USDT"))
+
+        exchange.symbol_map = bidict({"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"})
+
+        self.assertEqual(
+            {"BTCUSDT": "BTC-USDT", "ETHUSDT": "ETH-USDT"},
+            await RateSourceBase._trading_pair_symbol_map(exchange, "USDT"),
+        )
@@ -1,8 +1,8 @@
-
 from decimal import Decimal
 from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, patch
 
-from aioresponses import aioresponses
+from bidict import bidict
 
 from hummingbot.core.rate_oracle.sources.wazirx_rate_source import WazirxRateSource
 
@@ -10,203 +10,158 @@ from hummingbot.core.rate_oracle.sources.wazirx_rate_source import WazirxRateSou
 class WazirxRateSourceTests(IsolatedAsyncioWrapperTestCase):
     def setUp(self) -> None:
         super().setUp()
-        self.source = WazirxRateSource()
+        # The TTL cache is keyed on the instance repr, which a new instance can reuse from a collected one
+        WazirxRateSource._get_all_pairs_prices.cache_clear()
 
-    def test_name(self):
-        self.assertEqual("wazirx", self.source.name)
-
-    def test_parse_trading_pair_with_base_quote_units(self):
-        ticker_obj = {
-            "base_unit": "btc",
-            "quote_unit": "usdt"
-        }
-        parsed = self.source._parse_trading_pair("btcusdt", ticker_obj)
-        self.assertIsNotNone(parsed)
-        self.assertEqual(parsed.get("trading_pair"), "BTC-USDT")
-        self.assertEqual(parsed.get("base"), "BTC")
-        self.assertEqual(parsed.get("quote"), "USDT")
-
-    def test_parse_trading_pair_with_base_quote_fields(self):
-        ticker_obj = {
-            "base": "eth",
-            "quote": "btc"
-        }
-        parsed = self.source._parse_trading_pair("ethbtc", ticker_obj)
-        self.assertIsNotNone(parsed)
-        self.assertEqual(parsed.get("trading_pair"), "ETH-BTC")
-
-    def test_parse_trading_pair_fallback_parsing(self):
-        ticker_obj = {}
-        parsed = self.source._parse_trading_pair("btcusdt", ticker_obj)
-        self.assertIsNotNone(parsed)
-        self.assertEqual(parsed.get("trading_pair"), "BTC-USDT")
-
-    def test_parse_trading_pair_fallback_inr(self):
-        ticker_obj = {}
-        parsed = self.source._parse_trading_pair("btcinr", ticker_obj)
-        self.assertIsNotNone(parsed)
-        self.assertEqual(parsed.get("trading_pair"), "BTC-INR")
-
-    def test_parse_trading_pair_invalid_key(self):
-        ticker_obj = {}
-        parsed = self.source._parse_trading_pair("invalid", ticker_obj)
-        self.assertIsNone(parsed)
-
-    def test_parse_trading_pair_exception_handling(self):
-        ticker_obj = None
-        parsed = self.source._parse_trading_pair("btcusdt", ticker_obj)
-        self.assertIsNone(parsed)
-
-    @aioresponses()
-    async def test_get_prices_success(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "50000.0",
-                "sell": "50010.0"
-            },
-            "ethusdt": {
-                "base_unit": "eth",
-                "quote_unit": "usdt",
-                "buy": "3000.0",
-                "sell": "3010.0"
-            }
-        }
-
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
-
-        prices = await self.source.get_prices()
-        self.assertIn("BTC-USDT", prices)
-        self.assertIn("ETH-USDT", prices)
-        self.assertEqual(Decimal("50005.0"), prices["BTC-USDT"])
-        self.assertEqual(Decimal("3005.0"), prices["ETH-USDT"])
-
-    @aioresponses()
-    async def test_get_prices_with_quote_filter(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "50000.0",
-                "sell": "50010.0"
-            },
-            "btcinr": {
-                "base_unit": "btc",
-                "quote_unit": "inr",
-                "buy": "4000000.0",
-                "sell": "4001000.0"
-            }
-        }
-
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
-
-        prices = await self.source.get_prices(quote_token="USDT")
-        self.assertIn("BTC-USDT", prices)
-        self.assertNotIn("BTC-INR", prices)
-
-    @aioresponses()
-    async def test_get_prices_api_error(self, mock_api):
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", status=500)
-
-        prices = await self.source.get_prices()
-        self.assertEqual({}, prices)
+    def setup_wazirx_responses(self, mock_tickers, mapping=None):
+        exchange = WazirxRateSource()._build_exchange()
+        if mapping is None:
+            mapping = bidict({"btcusdt": "BTC-USDT", "btcinr": "BTC-INR"})
+        exchange._set_trading_pair_symbol_map(mapping)
 
-    @aioresponses()
-    async def test_get_prices_invalid_data(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "invalid",
-                "sell": "50010.0"
-            }
-        }
+        exchange.get_all_pairs_prices = AsyncMock(return_value=mock_tickers)
+        return exchange
 
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
+    def test_name(self):
+        self.assertEqual("wazirx", WazirxRateSource().name)
 
-        prices = await self.source.get_prices()
-        self.assertEqual({}, prices)
+    async def test_get_prices_success(self):
+        tickers = [
+            {"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"},
+            {"symbol": "btcinr", "bidPrice": "4000000.0", "askPrice": "4001000.0"},
+        ]
+        fake_ex = self.setup_wazirx_responses(tickers)
 
-    @aioresponses()
-    async def test_get_prices_missing_buy_sell(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": None,
-                "sell": "50010.0"
-            }
-        }
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
 
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
+        self.assertEqual(
+            {"BTC-USDT": Decimal("50005.0"), "BTC-INR": Decimal("4000500.0")},
+            prices,
+        )
 
-        prices = await self.source.get_prices()
-        self.assertEqual({}, prices)
+    async def test_get_bid_ask_prices_success(self):
+        tickers = [{"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"}]
+        fake_ex = self.setup_wazirx_responses(tickers)
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_bid_ask_prices()
 
-    @aioresponses()
-    async def test_get_bid_ask_prices_success(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "50000.0",
-                "sell": "50010.0"
-            }
-        }
-
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
-
-        prices = await self.source.get_bid_ask_prices()
-        self.assertIn("BTC-USDT", prices)
         data = prices["BTC-USDT"]
         self.assertEqual(Decimal("50000.0"), data["bid"])
         self.assertEqual(Decimal("50010.0"), data["ask"])
         self.assertEqual(Decimal("50005.0"), data["mid"])
-        self.assertAlmostEqual(Decimal("10.0"), data["spread"], places=2)
-
-    @aioresponses()
-    async def test_get_bid_ask_prices_with_quote_filter(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "50000.0",
-                "sell": "50010.0"
-            },
-            "btcinr": {
-                "base_unit": "btc",
-                "quote_unit": "inr",
-                "buy": "4000000.0",
-                "sell": "4001000.0"
-            }
-        }
-
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
-
-        prices = await self.source.get_bid_ask_prices(quote_token="INR")
-        self.assertNotIn("BTC-USDT", prices)
-        self.assertIn("BTC-INR", prices)
-
-    @aioresponses()
-    async def test_get_bid_ask_prices_api_error(self, mock_api):
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", status=404)
-
-        prices = await self.source.get_bid_ask_prices()
+        self.assertEqual((Decimal("10.0") / Decimal("50005.0")) * Decimal("100"), data["spread"])
+
+    async def test_tickers_fetched_once_for_prices_and_bid_ask_prices(self):
+        tickers = [{"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"}]
+        fake_ex = self.setup_wazirx_responses(tickers)
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+            bid_ask_prices = await rate_source.get_bid_ask_prices()
+
+        fake_ex.get_all_pairs_prices.assert_awaited_once()
+        self.assertEqual({"BTC-USDT": Decimal("50005.0")}, prices)
+        self.assertEqual(Decimal("50005.0"), bid_ask_prices["BTC-USDT"]["mid"])
+
+    async def test_prices_follow_the_ticker_cache(self):
+        fake_ex = self.setup_wazirx_responses([{"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"}])
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            first_bid_ask_prices = await rate_source.get_bid_ask_prices()
+            # Expiring the ticker cache must refresh both views; they keep no cache of their own
+            WazirxRateSource._get_all_pairs_prices.cache_clear()
+            fake_ex.get_all_pairs_prices.return_value = [
+                {"symbol": "btcusdt", "bidPrice": "51000.0", "askPrice": "51010.0"}
+            ]
+            prices = await rate_source.get_prices()
+            bid_ask_prices = await rate_source.get_bid_ask_prices()
+
+        self.assertEqual(Decimal("50005.0"), first_bid_ask_prices["BTC-USDT"]["mid"])
+        self.assertEqual({"BTC-USDT": Decimal("51005.0")}, prices)
+        self.assertEqual(Decimal("51005.0"), bid_ask_prices["BTC-USDT"]["mid"])
+        self.assertEqual(2, fake_ex.get_all_pairs_prices.await_count)
+
+    async def test_get_prices_with_quote_filter(self):
+        tickers = [
+            {"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"},
+            {"symbol": "btcinr", "bidPrice": "4000000.0", "askPrice": "4001000.0"},
+        ]
+        fake_ex = self.setup_wazirx_responses(tickers)
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            usdt_prices = await rate_source.get_prices(quote_token="USDT")
+            inr_bid_ask_prices = await rate_source.get_bid_ask_prices(quote_token="INR")
+
+        self.assertEqual({"BTC-USDT": Decimal("50005.0")}, usdt_prices)
+        self.assertEqual(["BTC-INR"], list(inr_bid_ask_prices))
+
+    async def test_symbol_missing_from_map_falls_back_to_base_and_quote_assets(self):
+        tickers = [
+            {"symbol": "btcusdt", "bidPrice": "50000.0", "askPrice": "50010.0"},
+            {"symbol": "ethusdt", "baseAsset": "eth", "quoteAsset": "usdt", "bidPrice": "3000", "askPrice": "3010"},
+            {"symbol": "solusdt", "baseAsset": "sol", "bidPrice": "100", "askPrice": "101"},
+            {"symbol": "xrpusdt", "bidPrice": "1", "askPrice": "2"},
+        ]
+        fake_ex = self.setup_wazirx_responses(tickers, mapping=bidict({"btcusdt": "BTC-USDT"}))
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+
+        self.assertEqual({"BTC-USDT": Decimal("50005.0"), "ETH-USDT": Decimal("3005")}, prices)
+
+    def test_resolve_trading_pair_prefers_symbol_map(self):
+        symbol_map = bidict({"btcusdt": "BTC-USDT"})
+
+        self.assertEqual(
+            "BTC-USDT",
+            WazirxRateSource._resolve_trading_pair(
+                symbol_map=symbol_map, pair_price={"symbol": "btcusdt", "baseAsset": "xbt", "quoteAsset": "usd"}
+            ),
+        )
+        self.assertEqual(
+            "ETH-INR",
+            WazirxRateSource._resolve_trading_pair(
+                symbol_map=symbol_map, pair_price={"symbol": "ethinr", "baseAsset": "eth", "quoteAsset": "inr"}
+            ),
+        )
+        self.assertIsNone(
+            WazirxRateSource._resolve_trading_pair(symbol_map=symbol_map, pair_price={"symbol": "ethinr"})
+        )
+
+    async def test_get_prices_invalid_data(self):
+        tickers = [{"symbol": "btcusdt", "bidPrice": "invalid", "askPrice": "50010.0"}]
+        fake_ex = self.setup_wazirx_responses(tickers)
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+
+        self.assertEqual({}, prices)
+
+    async def test_get_prices_missing_bid_ask(self):
+        tickers = [{"symbol": "btcusdt", "bidPrice": None, "askPrice": "50010.0"}]
+        fake_ex = self.setup_wazirx_responses(tickers)
+
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_prices()
+
         self.assertEqual({}, prices)
 
-    @aioresponses()
-    async def test_get_bid_ask_prices_invalid_bid_ask(self, mock_api):
-        mock_data = {
-            "btcusdt": {
-                "base_unit": "btc",
-                "quote_unit": "usdt",
-                "buy": "50010.0",  # bid > ask
-                "sell": "50000.0"
-            }
-        }
+    async def test_get_bid_ask_prices_with_bid_greater_than_ask(self):
+        tickers = [{"symbol": "btcusdt", "bidPrice": "50010.0", "askPrice": "50000.0"}]
+        fake_ex = self.setup_wazirx_responses(tickers)
 
-        mock_api.get("https://api.wazirx.com/api/v2/tickers", payload=mock_data)
+        rate_source = WazirxRateSource()
+        with patch.object(rate_source, "_build_exchange", return_value=fake_ex):
+            prices = await rate_source.get_bid_ask_prices()
 
-        prices = await self.source.get_bid_ask_prices()
         self.assertEqual({}, prices)
@@ -1,6 +1,6 @@
-import unittest
 import asyncio
 import time
+import unittest
 
 from hummingbot.core.utils import async_ttl_cache
 
@@ -21,3 +21,52 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def test_async_ttl_cache_shares_in_flight_call(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=1)
+        async def slow_fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return len(calls)
+
+        async def fetch_concurrently():
+            return await asyncio.gather(*[slow_fetch() for _ in range(5)])
+
+        results = asyncio.get_event_loop().run_until_complete(fetch_concurrently())
+        self.assertEqual([1] * 5, results)
+        self.assertEqual(1, len(calls))
+
+    def test_async_ttl_cache_does_not_cache_exceptions(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=1)
+        async def failing_fetch():
+            calls.append(1)
+            raise ValueError("failed")
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                asyncio.get_event_loop().run_until_complete(failing_fetch())
+        self.assertEqual(2, len(calls))
+
+    def test_async_ttl_cache_clear_discards_in_flight_result(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=1)
+        async def slow_fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return len(calls)
+
+        async def clear_while_in_flight():
+            task = asyncio.ensure_future(slow_fetch())
+            await asyncio.sleep(0)
+            slow_fetch.cache_clear()
+            first = await task
+            second = await slow_fetch()
+            return first, second
+
+        results = asyncio.get_event_loop().run_until_complete(clear_while_in_flight())
+        self.assertEqual((1, 2), results)
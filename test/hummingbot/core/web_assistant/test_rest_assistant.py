@@ -7,6 +7,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -101,3 +102,26 @@ class RESTAssistantTest(IsolatedAsyncioWrapperTestCase):
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
         await aiohttp_client_session.close()
+
+    @aioresponses()
+    async def test_execute_request_decodes_with_custom_json_loads(self, mocked_api):
+        url = "https://www.test.com/url"
+        resp = [{"market": "BTCINR"}]
+        mocked_api.get(url, body=json.dumps(resp).encode())
+        decoded_texts = []
+
+        def json_loads(text: str):
+            decoded_texts.append(text)
+            return json.loads(text)
+
+        aiohttp_client_session = aiohttp.ClientSession()
+        connection = RESTConnection(aiohttp_client_session)
+        assistant = RESTAssistant(
+            connection, throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="url", limit=1, time_interval=1)])
+        )
+
+        ret = await assistant.execute_request(url=url, throttler_limit_id="url", json_loads=json_loads)
+
+        self.assertEqual(resp, ret)
+        self.assertEqual([json.dumps(resp)], decoded_texts)
+        await aiohttp_client_session.close()
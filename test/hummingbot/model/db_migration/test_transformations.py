@@ -1,7 +1,12 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from hummingbot.model.db_migration.transformations import (
+    AddTradeFeeInQuote,
+    ConvertMarketDataSpreadToFloat,
+    ConvertPriceAndAmountColumnsToBigint,
+    ReplaceMarketDataIndexes,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +46,54 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class ReplaceMarketDataIndexesTests(TestCase):
+    def test_name(self):
+        self.assertEqual("ReplaceMarketDataIndexes", ReplaceMarketDataIndexes(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261015, ReplaceMarketDataIndexes(self).to_version)
+
+    def test_apply_replaces_single_column_indexes(self):
+        executed_queries = []
+        mock = MagicMock()
+        mock.engine.execute.side_effect = lambda query: executed_queries.append(query)
+
+        ReplaceMarketDataIndexes(migrator=self).apply(mock)
+
+        self.assertEqual(
+            [
+                "drop index if exists idx_market_data_timestamp;",
+                "drop index if exists idx_market_data_trading_pair;",
+                "drop index if exists idx_market_data_exchange;",
+                'create index if not exists idx_market_data_trading_pair_timestamp on "MarketData" (trading_pair, timestamp);',
+            ],
+            executed_queries,
+        )
+
+
+class ConvertMarketDataSpreadToFloatTests(TestCase):
+    def test_name(self):
+        self.assertEqual("ConvertMarketDataSpreadToFloat", ConvertMarketDataSpreadToFloat(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261016, ConvertMarketDataSpreadToFloat(self).to_version)
+
+    def test_apply_rebuilds_market_data_table(self):
+        executed_queries = []
+        mock = MagicMock()
+        mock.engine.execute.side_effect = lambda query: executed_queries.append(query)
+
+        ConvertMarketDataSpreadToFloat(migrator=self).apply(mock)
+
+        self.assertIn("create table MarketData_dg_tmp", executed_queries[0])
+        self.assertIn("spread FLOAT,", executed_queries[0])
+        self.assertIn("primary key (timestamp, exchange, trading_pair)", executed_queries[0])
+        self.assertIn("CAST(spread AS REAL)", executed_queries[1])
+        self.assertEqual('drop table "MarketData";', executed_queries[2])
+        self.assertEqual('alter table MarketData_dg_tmp rename to "MarketData";', executed_queries[3])
+        self.assertEqual(
+            'create index idx_market_data_trading_pair_timestamp on "MarketData" (trading_pair, timestamp);',
+            executed_queries[4],
+        )
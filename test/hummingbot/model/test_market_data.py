@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from sqlalchemy import Float, create_engine
+from sqlalchemy.orm import Session
+
+from hummingbot.model.market_data import MarketData
+
+# Session queries configure every registered mapper, so the related models must be importable by name
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.trade_fill import TradeFill  # noqa: F401
+
+
+class MarketDataTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.engine = create_engine("sqlite:///:memory:")
+        MarketData.__table__.create(self.engine)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+        super().tearDown()
+
+    def test_spread_column_is_float(self):
+        self.assertIsInstance(MarketData.__table__.c.spread.type, Float)
+
+    def test_bulk_insert_round_trip(self):
+        rows = [
+            {
+                "timestamp": 1700000000,
+                "exchange": "binance",
+                "trading_pair": "BTC-USDT",
+                "mid_price": 50005.0,
+                "best_bid": 50000.0,
+                "best_ask": 50010.0,
+                "spread": 0.02,
+                "order_book": {"bid": [[50000.0, 1.0]], "ask": [[50010.0, 2.0]]},
+            },
+            {
+                "timestamp": 1700000000,
+                "exchange": "binance",
+                "trading_pair": "ETH-USDT",
+                "mid_price": 3000.5,
+                "best_bid": 3000.0,
+                "best_ask": 3001.0,
+                "spread": 0.0333,
+                "order_book": None,
+            },
+        ]
+
+        with Session(self.engine) as session:
+            MarketData.bulk_insert(session, rows)
+            session.commit()
+
+        with Session(self.engine) as session:
+            records = session.query(MarketData).order_by(MarketData.trading_pair).all()
+
+            self.assertEqual(2, len(records))
+            btc_record, eth_record = records[0], records[1]
+            self.assertEqual(1700000000, btc_record.timestamp)
+            self.assertEqual("binance", btc_record.exchange)
+            self.assertEqual("BTC-USDT", btc_record.trading_pair)
+            self.assertEqual(50005.0, btc_record.mid_price)
+            self.assertEqual(50000.0, btc_record.best_bid)
+            self.assertEqual(50010.0, btc_record.best_ask)
+            self.assertIsInstance(btc_record.spread, float)
+            self.assertEqual(0.02, btc_record.spread)
+            self.assertEqual({"bid": [[50000.0, 1.0]], "ask": [[50010.0, 2.0]]}, btc_record.order_book)
+
+            self.assertEqual("ETH-USDT", eth_record.trading_pair)
+            self.assertIsInstance(eth_record.spread, float)
+            self.assertEqual(0.0333, eth_record.spread)
+            self.assertIsNone(eth_record.order_book)
+
+    def test_bulk_insert_with_no_rows_does_nothing(self):
+        with Session(self.engine) as session:
+            MarketData.bulk_insert(session, [])
+            session.commit()
+            self.assertEqual(0, session.query(MarketData).count())
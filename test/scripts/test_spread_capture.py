@@ -0,0 +1,57 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock, patch
+
+from scripts.spread_capture import (
+    RATE_SOURCE_CLASSES,
+    SUPPORTED_CONNECTORS,
+    SpreadCapture,
+    SpreadCaptureConfig,
+    get_rate_source,
+)
+
+
+class SpreadCaptureTests(IsolatedAsyncioWrapperTestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.rate_source = MagicMock()
+        with patch("scripts.spread_capture.get_rate_source", return_value=self.rate_source):
+            self.strategy = SpreadCapture(connectors={}, config=SpreadCaptureConfig(connector_name="binance"))
+
+    def test_supported_connectors_match_rate_source_classes(self):
+        self.assertEqual(list(RATE_SOURCE_CLASSES), SUPPORTED_CONNECTORS)
+        self.assertIn("coinswitch", SUPPORTED_CONNECTORS)
+        self.assertNotIn("binance_perpetual", SUPPORTED_CONNECTORS)
+        with self.assertRaises(ValueError):
+            get_rate_source("binance_perpetual")
+
+    async def test_tick_during_unfinished_fetch_does_not_start_another_fetch(self):
+        release_fetch = asyncio.Event()
+
+        async def get_bid_ask_prices(quote_token=None):
+            await release_fetch.wait()
+            return {}
+
+        self.rate_source.get_bid_ask_prices = MagicMock(side_effect=get_bid_ask_prices)
+
+        self.strategy.on_tick()
+        first_task = self.strategy._fetch_task
+        await asyncio.sleep(0)
+        self.assertEqual(1, self.rate_source.get_bid_ask_prices.call_count)
+
+        self.strategy._next_run = 0.0
+        self.strategy.on_tick()
+        await asyncio.sleep(0)
+        self.assertIs(first_task, self.strategy._fetch_task)
+        self.assertEqual(1, self.rate_source.get_bid_ask_prices.call_count)
+
+        release_fetch.set()
+        await first_task
+
+        self.strategy._next_run = 0.0
+        self.strategy.on_tick()
+        second_task = self.strategy._fetch_task
+        await second_task
+        self.assertIsNot(first_task, second_task)
+        self.assertEqual(2, self.rate_source.get_bid_ask_prices.call_count)